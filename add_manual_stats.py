@@ -5,7 +5,11 @@ This allows you to add new experimental results without having the full result f
 """
 
 import pandas as pd
+import io
 import os
+import sys
+
+TEMPLATE_HEADER = "algorithm,grid_size,robot_count,total_communications,final_position_error,final_rotation_error,position_convergence_comm,position_convergence_iter,position_convergence_time"
 
 def input_new_method_stats():
     """Interactive function to input new method statistics."""
@@ -126,15 +130,8 @@ def input_new_method_stats():
     
     # Combine with existing data
     if len(existing_df) > 0:
-        # Ensure columns match
-        all_columns = set(existing_df.columns) | set(new_df.columns)
-        for col in all_columns:
-            if col not in existing_df.columns:
-                existing_df[col] = None
-            if col not in new_df.columns:
-                new_df[col] = None
-        
-        combined_df = pd.concat([existing_df, new_df], ignore_index=True)
+        # concat unions the columns, filling the missing ones with NaN
+        combined_df = pd.concat([existing_df, new_df], ignore_index=True, sort=False)
     else:
         combined_df = new_df
     
@@ -151,25 +148,24 @@ def input_new_method_stats():
 def update_summary_files(df):
     """Update summary files with the new data."""
     
-    # Update position convergence summary
-    summary_data = []
-    for algorithm in sorted(df['algorithm'].unique()):
-        alg_data = df[df['algorithm'] == algorithm]
-        for robot_count in sorted(alg_data['robot_count'].unique()):
-            robot_data = alg_data[alg_data['robot_count'] == robot_count]
-            if len(robot_data) > 0:
-                row_data = robot_data.iloc[0]
-                summary_data.append({
-                    'Algorithm': algorithm,
-                    'Robot_Count': int(robot_count),
-                    'Convergence_Communications': row_data.get('position_convergence_comm', 'N/A'),
-                    'Convergence_Iterations': row_data.get('position_convergence_iteration', 'N/A'),
-                    'Convergence_Time_s': row_data.get('position_convergence_time', 'N/A'),
-                    'Final_Position_Error': row_data.get('final_position_error', 'N/A')
-                })
+    # Update position convergence summary: first entry per (algorithm, robot count)
+    summary_df = (df.reindex(columns=['algorithm', 'robot_count', 'position_convergence_comm',
+                                      'position_convergence_iteration', 'position_convergence_time',
+                                      'final_position_error'])
+                  .groupby(['algorithm', 'robot_count'], sort=True)
+                  .first(skipna=False)
+                  .reset_index()
+                  .rename(columns={
+                      'algorithm': 'Algorithm',
+                      'robot_count': 'Robot_Count',
+                      'position_convergence_comm': 'Convergence_Communications',
+                      'position_convergence_iteration': 'Convergence_Iterations',
+                      'position_convergence_time': 'Convergence_Time_s',
+                      'final_position_error': 'Final_Position_Error'
+                  }))
+    summary_df['Robot_Count'] = summary_df['Robot_Count'].astype(int)
     
-    summary_df = pd.DataFrame(summary_data)
-    summary_df.to_csv('position_convergence_summary.csv', index=False)
+    summary_df.to_csv('position_convergence_summary.csv', index=False, lineterminator='\n')
     print("Updated: position_convergence_summary.csv")
 
 def show_template():
@@ -177,12 +173,84 @@ def show_template():
     
     print("\nTemplate for bulk data entry (CSV format):")
     print("=" * 60)
-    print("algorithm,grid_size,robot_count,total_communications,final_position_error,final_rotation_error,position_convergence_comm,position_convergence_iter,position_convergence_time")
+    print(TEMPLATE_HEADER)
     print("new_algorithm,15_15,15,9000,0.02,0.01,8500,850,600.5")
     print("new_algorithm,14_14,14,8000,0.025,0.012,7500,750,550.2")
     print("# Use 'final' for convergence values to use total values")
     print("# Example: algorithm,grid_size,robot_count,total_comm,final_pos_err,final_rot_err,final,final,final")
 
+def _resolve_final(new_data, column, final_value):
+    """Return a column as numbers, using final_value for 'final' entries or if the column is missing."""
+    if column not in new_data.columns:
+        return pd.Series(final_value, index=new_data.index, dtype=float)
+    values = new_data[column]
+    is_final = values.astype(str).str.strip().str.lower() == 'final'
+    return pd.to_numeric(values.mask(is_final), errors='coerce').mask(is_final, final_value)
+
+def process_manual_data(new_data):
+    """Convert rows in the bulk template format into analysis entries."""
+    
+    total_comm = new_data['total_communications']
+    
+    # Handle 'final' values
+    pos_conv_comm = _resolve_final(new_data, 'position_convergence_comm', total_comm)
+    pos_conv_iter = _resolve_final(new_data, 'position_convergence_iter', pos_conv_comm)
+    pos_conv_time = _resolve_final(new_data, 'position_convergence_time', 500.0)  # Default time
+    
+    pos_conv_ratio = (pos_conv_comm / total_comm).where(total_comm > 0, 0)
+    
+    experiment_name = 'grid_' + new_data['grid_size'].astype(str) + '_' + new_data['algorithm'].astype(str) + '_manual_input'
+    
+    return pd.DataFrame({
+        'file_path': 'manual_input/' + experiment_name + '/residual_and_ate.txt',
+        'total_communications': total_comm,
+        'final_position_error': new_data['final_position_error'],
+        'final_rotation_error': new_data['final_rotation_error'],
+        'position_convergence_comm': pos_conv_comm,
+        'rotation_convergence_comm': pos_conv_comm,
+        'position_convergence_ratio': pos_conv_ratio,
+        'rotation_convergence_ratio': pos_conv_ratio,
+        'total_iterations': pos_conv_iter,
+        'experiment_name': experiment_name,
+        'algorithm': new_data['algorithm'],
+        'grid_size': new_data['grid_size'],
+        'robot_count': new_data['robot_count'],
+        'position_convergence_iteration': pos_conv_iter,
+        'position_convergence_time': pos_conv_time,
+        'rotation_convergence_iteration': pos_conv_iter,
+        'rotation_convergence_time': pos_conv_time
+    })
+
+def add_bulk_data(new_data, source):
+    """Validate rows in the bulk template format and append them to the analysis."""
+    
+    required_cols = ['algorithm', 'grid_size', 'robot_count', 'total_communications', 
+                    'final_position_error', 'final_rotation_error']
+    
+    if not all(col in new_data.columns for col in required_cols):
+        print(f"CSV must contain columns: {required_cols}")
+        return
+    
+    # Load existing data
+    try:
+        existing_df = pd.read_csv('enhanced_convergence_analysis.csv')
+    except FileNotFoundError:
+        existing_df = pd.DataFrame()
+    
+    # Process new data
+    new_df = process_manual_data(new_data)
+    
+    # Combine and save
+    if len(existing_df) > 0:
+        combined_df = pd.concat([existing_df, new_df], ignore_index=True, sort=False)
+    else:
+        combined_df = new_df
+    
+    combined_df.to_csv('enhanced_convergence_analysis.csv', index=False)
+    update_summary_files(combined_df)
+    
+    print(f"Successfully loaded {len(new_df)} entries from {source}")
+
 def load_from_csv():
     """Load data from a CSV file."""
     
@@ -192,79 +260,30 @@ def load_from_csv():
         return
     
     try:
-        new_data = pd.read_csv(csv_file)
-        required_cols = ['algorithm', 'grid_size', 'robot_count', 'total_communications', 
-                        'final_position_error', 'final_rotation_error']
-        
-        if not all(col in new_data.columns for col in required_cols):
-            print(f"CSV must contain columns: {required_cols}")
-            return
-        
-        # Load existing data
-        try:
-            existing_df = pd.read_csv('enhanced_convergence_analysis.csv')
-        except FileNotFoundError:
-            existing_df = pd.DataFrame()
-        
-        # Process new data
-        processed_entries = []
-        for _, row in new_data.iterrows():
-            # Handle 'final' values
-            pos_conv_comm = row['total_communications'] if str(row.get('position_convergence_comm', '')).lower() == 'final' else row.get('position_convergence_comm', row['total_communications'])
-            pos_conv_iter = row.get('position_convergence_iter', pos_conv_comm)
-            pos_conv_time = row.get('position_convergence_time', 500.0)  # Default time
-            
-            if str(pos_conv_iter).lower() == 'final':
-                pos_conv_iter = pos_conv_comm
-            if str(pos_conv_time).lower() == 'final':
-                pos_conv_time = 500.0  # You'll need to provide this
-            
-            pos_conv_ratio = pos_conv_comm / row['total_communications'] if row['total_communications'] > 0 else 0
-            
-            experiment_name = f"grid_{row['grid_size']}_{row['algorithm']}_manual_input"
-            
-            entry = {
-                'file_path': f'manual_input/{experiment_name}/residual_and_ate.txt',
-                'total_communications': row['total_communications'],
-                'final_position_error': row['final_position_error'],
-                'final_rotation_error': row['final_rotation_error'],
-                'position_convergence_comm': pos_conv_comm,
-                'rotation_convergence_comm': pos_conv_comm,
-                'position_convergence_ratio': pos_conv_ratio,
-                'rotation_convergence_ratio': pos_conv_ratio,
-                'total_iterations': pos_conv_iter,
-                'experiment_name': experiment_name,
-                'algorithm': row['algorithm'],
-                'grid_size': row['grid_size'],
-                'robot_count': row['robot_count'],
-                'position_convergence_iteration': pos_conv_iter,
-                'position_convergence_time': pos_conv_time,
-                'rotation_convergence_iteration': pos_conv_iter,
-                'rotation_convergence_time': pos_conv_time
-            }
-            processed_entries.append(entry)
-        
-        # Combine and save
-        new_df = pd.DataFrame(processed_entries)
-        if len(existing_df) > 0:
-            all_columns = set(existing_df.columns) | set(new_df.columns)
-            for col in all_columns:
-                if col not in existing_df.columns:
-                    existing_df[col] = None
-                if col not in new_df.columns:
-                    new_df[col] = None
-            combined_df = pd.concat([existing_df, new_df], ignore_index=True)
-        else:
-            combined_df = new_df
-        
-        combined_df.to_csv('enhanced_convergence_analysis.csv', index=False)
-        update_summary_files(combined_df)
-        
-        print(f"Successfully loaded {len(processed_entries)} entries from {csv_file}")
-        
+        add_bulk_data(pd.read_csv(csv_file), csv_file)
     except Exception as e:
         print(f"Error loading CSV: {e}")
 
+def input_bulk_paste():
+    """Read pasted rows in the CSV template format from stdin in one go."""
+    
+    print("\nPaste rows in the CSV template format (header line optional).")
+    print("Lines starting with '#' are ignored. Finish with Ctrl-D.")
+    raw = sys.stdin.read()
+    
+    lines = [line.strip() for line in raw.splitlines()]
+    lines = [line for line in lines if line and not line.startswith('#')]
+    if not lines:
+        print("No new entries added.")
+        return
+    if not lines[0].startswith('algorithm,'):
+        lines.insert(0, TEMPLATE_HEADER)
+    
+    try:
+        add_bulk_data(pd.read_csv(io.StringIO("\n".join(lines))), "pasted input")
+    except Exception as e:
+        print(f"Error parsing pasted input: {e}")
+
 def main():
     print("Manual Method Statistics Input Tool")
     print("=" * 40)
@@ -272,9 +291,14 @@ def main():
     print("2. Load from CSV file")
     print("3. Show CSV template")
     print("4. Exit")
+    print("5. Bulk paste (CSV rows from stdin)")
     
     while True:
-        choice = input("\nChoose option (1-4): ").strip()
+        try:
+            choice = input("\nChoose option (1-5): ").strip()
+        except EOFError:
+            # stdin is exhausted, e.g. after a piped bulk paste
+            break
         
         if choice == '1':
             input_new_method_stats()
@@ -284,6 +308,8 @@ def main():
             show_template()
         elif choice == '4':
             break
+        elif choice == '5':
+            input_bulk_paste()
         else:
             print("Invalid choice!")
 
@@ -7,14 +7,98 @@ reach within 1% of their final values.
 
 import os
 import glob
+import pickle
+import re
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
 from pathlib import Path
 
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; without it the scan falls back to numpy
+    njit = None
+
+# Bytes read from the end of a residual file to find its final row
+RESIDUAL_TAIL_BYTES = 64 * 1024
+# residual_and_ate.txt columns are: communications, residual, position errors,
+# rotation errors. Only these are parsed; the residual is never used here.
+RESIDUAL_USECOLS = (0, 2, 3)
+# Read buffer / block size used when streaming a residual file forward
+RESIDUAL_READ_BUFFER = 256 * 1024
+# Parsed results of unchanged residual files are reused across runs
+CACHE_FILE = "convergence_cache.pkl"
+# Grid size and algorithm in experiment folder names such as
+# grid_10_10_geodesic-mesa_2025-08-10_14-37-53. Both groups are optional so
+# a name missing one still yields the other.
+EXPERIMENT_NAME_RE = re.compile(
+    r'^(?=(?:.*?grid_(?P<grid_size>\d+_\d+)_)?)(?:.*?_(?P<algorithm>[^_]+)_\d{4}-\d{2}-\d{2})?')
+
+
+def _first_crossings_numpy(position_errors, rotation_errors, position_threshold, rotation_threshold):
+    """
+    Find the first index at which each error column drops to or below its threshold.
+    
+    Returns:
+        tuple: (position_idx, rotation_idx), -1 where the threshold is never reached
+    """
+    # argmax returns the first True without building the list of all matches;
+    # it returns 0 for an all-False mask, hence the check on the mask value
+    position_mask = position_errors <= position_threshold
+    rotation_mask = rotation_errors <= rotation_threshold
+    position_idx = int(position_mask.argmax())
+    rotation_idx = int(rotation_mask.argmax())
+    return (position_idx if position_mask[position_idx] else -1,
+            rotation_idx if rotation_mask[rotation_idx] else -1)
+
+
+if njit is not None:
+    @njit("UniTuple(int64, 2)(float64[:], float64[:], float64, float64)", cache=True)
+    def _first_crossings(position_errors, rotation_errors, position_threshold, rotation_threshold):
+        # Same contract as _first_crossings_numpy, as a single fused loop that
+        # stops at the first row where both metrics have converged
+        position_idx = -1
+        rotation_idx = -1
+        for i in range(position_errors.shape[0]):
+            if position_idx < 0 and position_errors[i] <= position_threshold:
+                position_idx = i
+            if rotation_idx < 0 and rotation_errors[i] <= rotation_threshold:
+                rotation_idx = i
+            if position_idx >= 0 and rotation_idx >= 0:
+                break
+        return position_idx, rotation_idx
+else:
+    _first_crossings = _first_crossings_numpy
+
+
+def _read_final_row(f):
+    """
+    Parse the last row of an open residual file by reading only its tail.
+    
+    Returns:
+        tuple: (final row as a float array or None if the file is empty,
+                whether the file ends with a newline)
+    """
+    f.seek(0, os.SEEK_END)
+    size = f.tell()
+    f.seek(max(0, size - RESIDUAL_TAIL_BYTES))
+    tail = f.read()
+    
+    for line in reversed(tail.splitlines()):
+        if line.strip():
+            return np.array(line.split(), dtype=np.float64), tail.endswith(b'\n')
+    return None, True
+
+
 def analyze_convergence(file_path):
     """
     Analyze a single residual_and_ate.txt file to find convergence points.
     
+    The final values are taken from the tail of the file, then the file is
+    streamed forward in bounded blocks and parsing stops once both metrics
+    have converged; remaining rows are only counted.
+    
     Args:
         file_path: Path to the residual_and_ate.txt file
         
@@ -22,39 +106,54 @@ def analyze_convergence(file_path):
         dict: Contains convergence information
     """
     try:
-        # Read the data
-        data = pd.read_csv(file_path, sep=' ', header=None, 
-                          names=['communications', 'residual', 'position_errors', 'rotation_errors'])
-        
-        if len(data) == 0:
-            return None
+        with open(file_path, 'rb', buffering=RESIDUAL_READ_BUFFER) as f:
+            final_row, ends_with_newline = _read_final_row(f)
             
-        # Get final values (last row)
-        final_position_error = data['position_errors'].iloc[-1]
-        final_rotation_error = data['rotation_errors'].iloc[-1]
-        final_communications = data['communications'].iloc[-1]
-        
-        # Calculate 1% thresholds
-        position_threshold = final_position_error * 1.01  # Within 1% means <= 101% of final
-        rotation_threshold = final_rotation_error * 1.01
-        
-        # Find first time each metric reaches within 1% of final value
-        position_convergence_idx = data[data['position_errors'] <= position_threshold].index
-        rotation_convergence_idx = data[data['rotation_errors'] <= rotation_threshold].index
-        
-        position_convergence_comm = None
-        rotation_convergence_comm = None
+            if final_row is None:
+                return None
+                
+            # Get final values (last row)
+            final_communications, final_position_error, final_rotation_error = final_row[list(RESIDUAL_USECOLS)]
+            final_communications = int(final_communications)
+            
+            # Calculate 1% thresholds
+            position_threshold = final_position_error * 1.01  # Within 1% means <= 101% of final
+            rotation_threshold = final_rotation_error * 1.01
+            
+            # Find first time each metric reaches within 1% of final value
+            f.seek(0)
+            position_convergence_comm = None
+            rotation_convergence_comm = None
+            total_iterations = 0
+            
+            while position_convergence_comm is None or rotation_convergence_comm is None:
+                lines = f.readlines(RESIDUAL_READ_BUFFER)
+                if not lines:
+                    break
+                block = np.loadtxt(lines, dtype=np.float64, usecols=RESIDUAL_USECOLS, ndmin=2)
+                total_iterations += len(block)
+                
+                position_idx, rotation_idx = _first_crossings(
+                    block[:, 1], block[:, 2], position_threshold, rotation_threshold)
+                if position_convergence_comm is None and position_idx >= 0:
+                    position_convergence_comm = int(block[position_idx, 0])
+                if rotation_convergence_comm is None and rotation_idx >= 0:
+                    rotation_convergence_comm = int(block[rotation_idx, 0])
+            
+            # Count the rows after the convergence point without parsing them
+            remaining_newlines = 0
+            remaining_bytes = 0
+            for chunk in iter(lambda: f.read(RESIDUAL_READ_BUFFER), b''):
+                remaining_newlines += chunk.count(b'\n')
+                remaining_bytes += len(chunk)
+            total_iterations += remaining_newlines
+            if remaining_bytes > 0 and not ends_with_newline:
+                total_iterations += 1
         
-        if len(position_convergence_idx) > 0:
-            position_convergence_comm = data.loc[position_convergence_idx[0], 'communications']
-        else:
-            # If never converged within 1%, use final communications
+        # If never converged within 1%, use final communications
+        if position_convergence_comm is None:
             position_convergence_comm = final_communications
-            
-        if len(rotation_convergence_idx) > 0:
-            rotation_convergence_comm = data.loc[rotation_convergence_idx[0], 'communications']
-        else:
-            # If never converged within 1%, use final communications
+        if rotation_convergence_comm is None:
             rotation_convergence_comm = final_communications
         
         return {
@@ -66,13 +165,32 @@ def analyze_convergence(file_path):
             'rotation_convergence_comm': rotation_convergence_comm,
             'position_convergence_ratio': position_convergence_comm / final_communications if position_convergence_comm is not None else 1.0,
             'rotation_convergence_ratio': rotation_convergence_comm / final_communications if rotation_convergence_comm is not None else 1.0,
-            'total_iterations': len(data)
+            'total_iterations': total_iterations
         }
         
     except Exception as e:
         print(f"Error processing {file_path}: {e}")
         return None
 
+def load_cache(cache_file):
+    """Load cached per-file results keyed by (path, st_mtime_ns, st_size)."""
+    try:
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+    except (FileNotFoundError, EOFError, pickle.UnpicklingError) as e:
+        if not isinstance(e, FileNotFoundError):
+            print(f"Ignoring unreadable cache {cache_file}: {e}")
+        return {}
+
+def save_cache(cache, cache_file):
+    """Persist cached per-file results."""
+    with open(cache_file, 'wb') as f:
+        pickle.dump(cache, f, protocol=5)
+
+def _format_column(values, template, missing):
+    """Format each value of a Series with template, using missing for NaN entries."""
+    return values.map(lambda v: template.format(v) if pd.notna(v) else missing)
+
 def main():
     # Find all result folders
     results_dir = "data/results/seq"
@@ -81,36 +199,68 @@ def main():
         print(f"Results directory {results_dir} not found!")
         return
     
-    # Get all subdirectories
-    result_folders = [d for d in os.listdir(results_dir) 
-                     if os.path.isdir(os.path.join(results_dir, d))]
+    # Get all subdirectories (scandir reports the entry type without a stat per entry)
+    with os.scandir(results_dir) as it:
+        result_folders = sorted((entry for entry in it if entry.is_dir()),
+                                key=lambda entry: entry.name)
     
     print(f"Found {len(result_folders)} result folders")
     
     all_results = []
     processed_count = 0
     skipped_count = 0
+    cached_count = 0
+    
+    cache = load_cache(CACHE_FILE)
+    # Only entries for files seen in this run are kept, so stale ones drop out
+    new_cache = {}
     
-    for folder in sorted(result_folders):
-        folder_path = os.path.join(results_dir, folder)
-        residual_file = os.path.join(folder_path, "residual_and_ate.txt")
+    # Resolve cache hits first; the remaining files are analyzed in parallel
+    entries = []
+    pending = []
+    for entry in result_folders:
+        folder = entry.name
+        residual_file = os.path.join(entry.path, "residual_and_ate.txt")
         
-        if not os.path.exists(residual_file):
+        try:
+            stat = os.stat(residual_file)
+        except FileNotFoundError:
             print(f"Skipping {folder}: no residual_and_ate.txt file")
             skipped_count += 1
             continue
             
-        print(f"Processing {folder}...")
-        result = analyze_convergence(residual_file)
+        cache_key = (residual_file, stat.st_mtime_ns, stat.st_size)
+        result = cache.get(cache_key)
         
         if result is not None:
-            result['experiment_name'] = folder
+            cached_count += 1
+        else:
+            print(f"Processing {folder}...")
+            pending.append(len(entries))
+        entries.append([folder, residual_file, cache_key, result])
+    
+    if pending:
+        # Each file is small, so hand several to a worker at a time to
+        # amortize the pickling of arguments and results
+        workers = os.cpu_count() or 1
+        chunksize = max(1, len(pending) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            files = [entries[i][1] for i in pending]
+            for i, result in zip(pending, executor.map(analyze_convergence, files, chunksize=chunksize)):
+                entries[i][3] = result
+    
+    for folder, residual_file, cache_key, result in entries:
+        if result is not None:
+            new_cache[cache_key] = result
+            result = dict(result, experiment_name=folder)
             all_results.append(result)
             processed_count += 1
         else:
             skipped_count += 1
     
-    print(f"\nProcessed {processed_count} files, skipped {skipped_count} files")
+    save_cache(new_cache, CACHE_FILE)
+    
+    print(f"\nProcessed {processed_count} files ({cached_count} from cache), skipped {skipped_count} files")
     
     if not all_results:
         print("No valid results found!")
@@ -119,67 +269,66 @@ def main():
     # Convert to DataFrame for easier analysis
     df = pd.DataFrame(all_results)
     
-    # Extract algorithm and grid size from experiment names
-    df['algorithm'] = df['experiment_name'].str.extract(r'_([^_]+)_\d{4}-\d{2}-\d{2}')
-    df['grid_size'] = df['experiment_name'].str.extract(r'grid_(\d+_\d+)_')
+    # Extract algorithm and grid size from experiment names in a single pass
+    extracted = df['experiment_name'].str.extract(EXPERIMENT_NAME_RE)
+    df['algorithm'] = extracted['algorithm']
+    df['grid_size'] = extracted['grid_size']
     
     # Create output file
     output_file = "convergence_analysis_results.txt"
     
-    with open(output_file, 'w') as f:
-        f.write("Convergence Analysis Results\n")
-        f.write("=" * 50 + "\n\n")
-        f.write("Columns explanation:\n")
-        f.write("- experiment_name: Name of the experiment folder\n")
-        f.write("- algorithm: Algorithm used (extracted from folder name)\n")
-        f.write("- grid_size: Grid dimensions (extracted from folder name)\n")
-        f.write("- total_communications: Total communications in the experiment\n")
-        f.write("- final_position_error: Final APE (Absolute Position Error)\n")
-        f.write("- final_rotation_error: Final ATE (Absolute Translation Error)\n")
-        f.write("- position_convergence_comm: Communications when APE reached within 1% of final\n")
-        f.write("- rotation_convergence_comm: Communications when ATE reached within 1% of final\n")
-        f.write("- position_convergence_ratio: Ratio of convergence comm to total comm (APE)\n")
-        f.write("- rotation_convergence_ratio: Ratio of convergence comm to total comm (ATE)\n")
-        f.write("- total_iterations: Total number of data points in the file\n\n")
-        
-        # Write detailed results
-        f.write("DETAILED RESULTS:\n")
-        f.write("-" * 100 + "\n")
-        
-        for _, row in df.iterrows():
-            f.write(f"Experiment: {row['experiment_name']}\n")
-            f.write(f"  Algorithm: {row['algorithm']}\n")
-            f.write(f"  Grid Size: {row['grid_size']}\n")
-            f.write(f"  Total Communications: {row['total_communications']:.0f}\n")
-            f.write(f"  Final Position Error: {row['final_position_error']:.6f}\n")
-            f.write(f"  Final Rotation Error: {row['final_rotation_error']:.6f}\n")
-            pos_conv = f"{row['position_convergence_comm']:.0f}" if pd.notna(row['position_convergence_comm']) else 'N/A'
-            f.write(f"  Position Convergence (1%): {pos_conv} communications")
-            if pd.notna(row['position_convergence_ratio']):
-                f.write(f" ({row['position_convergence_ratio']:.2%} of total)")
-            f.write("\n")
-            rot_conv = f"{row['rotation_convergence_comm']:.0f}" if pd.notna(row['rotation_convergence_comm']) else 'N/A'
-            f.write(f"  Rotation Convergence (1%): {rot_conv} communications")
-            if pd.notna(row['rotation_convergence_ratio']):
-                f.write(f" ({row['rotation_convergence_ratio']:.2%} of total)")
-            f.write("\n")
-            f.write(f"  Total Iterations: {row['total_iterations']}\n")
-            f.write("\n")
-        
-        # Summary statistics by algorithm
-        f.write("\nSUMMARY BY ALGORITHM:\n")
-        f.write("-" * 50 + "\n")
-        
-        for algorithm in df['algorithm'].unique():
-            if pd.isna(algorithm):
-                continue
-            alg_data = df[df['algorithm'] == algorithm]
-            f.write(f"\nAlgorithm: {algorithm}\n")
-            f.write(f"  Number of experiments: {len(alg_data)}\n")
-            f.write(f"  Average position convergence ratio: {alg_data['position_convergence_ratio'].mean():.2%}\n")
-            f.write(f"  Average rotation convergence ratio: {alg_data['rotation_convergence_ratio'].mean():.2%}\n")
-            f.write(f"  Average final position error: {alg_data['final_position_error'].mean():.6f}\n")
-            f.write(f"  Average final rotation error: {alg_data['final_rotation_error'].mean():.6f}\n")
+    # Build the whole report in memory and write it out in one go
+    report = [
+        "Convergence Analysis Results\n",
+        "=" * 50 + "\n\n",
+        "Columns explanation:\n",
+        "- experiment_name: Name of the experiment folder\n",
+        "- algorithm: Algorithm used (extracted from folder name)\n",
+        "- grid_size: Grid dimensions (extracted from folder name)\n",
+        "- total_communications: Total communications in the experiment\n",
+        "- final_position_error: Final APE (Absolute Position Error)\n",
+        "- final_rotation_error: Final ATE (Absolute Translation Error)\n",
+        "- position_convergence_comm: Communications when APE reached within 1% of final\n",
+        "- rotation_convergence_comm: Communications when ATE reached within 1% of final\n",
+        "- position_convergence_ratio: Ratio of convergence comm to total comm (APE)\n",
+        "- rotation_convergence_ratio: Ratio of convergence comm to total comm (ATE)\n",
+        "- total_iterations: Total number of data points in the file\n\n",
+    ]
+    
+    # Write detailed results
+    report.append("DETAILED RESULTS:\n")
+    report.append("-" * 100 + "\n")
+    
+    detailed = ("Experiment: " + df['experiment_name'].map(str) + "\n"
+                + "  Algorithm: " + df['algorithm'].map(str) + "\n"
+                + "  Grid Size: " + df['grid_size'].map(str) + "\n"
+                + "  Total Communications: " + df['total_communications'].map('{:.0f}'.format) + "\n"
+                + "  Final Position Error: " + df['final_position_error'].map('{:.6f}'.format) + "\n"
+                + "  Final Rotation Error: " + df['final_rotation_error'].map('{:.6f}'.format) + "\n"
+                + "  Position Convergence (1%): " + _format_column(df['position_convergence_comm'], '{:.0f}', 'N/A') + " communications"
+                + _format_column(df['position_convergence_ratio'], ' ({:.2%} of total)', '') + "\n"
+                + "  Rotation Convergence (1%): " + _format_column(df['rotation_convergence_comm'], '{:.0f}', 'N/A') + " communications"
+                + _format_column(df['rotation_convergence_ratio'], ' ({:.2%} of total)', '') + "\n"
+                + "  Total Iterations: " + df['total_iterations'].map(str) + "\n")
+    report.append("\n".join(detailed.tolist()) + "\n")
+    
+    # Summary statistics by algorithm
+    report.append("\nSUMMARY BY ALGORITHM:\n")
+    report.append("-" * 50 + "\n")
+    
+    for algorithm in df['algorithm'].unique():
+        if pd.isna(algorithm):
+            continue
+        alg_data = df[df['algorithm'] == algorithm]
+        report.append(f"\nAlgorithm: {algorithm}\n")
+        report.append(f"  Number of experiments: {len(alg_data)}\n")
+        report.append(f"  Average position convergence ratio: {alg_data['position_convergence_ratio'].mean():.2%}\n")
+        report.append(f"  Average rotation convergence ratio: {alg_data['rotation_convergence_ratio'].mean():.2%}\n")
+        report.append(f"  Average final position error: {alg_data['final_position_error'].mean():.6f}\n")
+        report.append(f"  Average final rotation error: {alg_data['final_rotation_error'].mean():.6f}\n")
+    
+    with open(output_file, 'w', buffering=1 << 20) as f:
+        f.write("".join(report))
     
     # Also save as CSV for further analysis
     csv_file = "convergence_analysis_results.csv"
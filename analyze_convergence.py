@@ -9,16 +9,39 @@ The script reads a text file with columns:
 - Rotation errors (ATE)
 """
 
-import numpy as np
 import argparse
+import os
 import sys
 from pathlib import Path
 
+# Bytes read from the end of the file to find the final row
+TAIL_BYTES = 4096
+# Read buffer used when streaming the file forward
+READ_BUFFER = 256 * 1024
+
+
+def read_final_row(f, tail_bytes=TAIL_BYTES):
+    """
+    Parse the last non-empty row of an open (binary) data file by reading only its tail.
+    
+    Returns:
+        list: Values of the last row, or None if the file is empty
+    """
+    f.seek(0, os.SEEK_END)
+    f.seek(max(0, f.tell() - tail_bytes))
+    for line in reversed(f.read().splitlines()):
+        if line.strip():
+            return [float(value) for value in line.split()]
+    return None
+
 
 def analyze_convergence(file_path, threshold_percent=1.0):
     """
     Analyze when APE and ATE reach within threshold_percent of their final values.
     
+    Only the tail of the file is read to get the final values; the file is then
+    streamed forward and reading stops once both metrics are within threshold.
+    
     Args:
         file_path (str): Path to the residual_and_ate.txt file
         threshold_percent (float): Percentage threshold (default: 1.0 for 1%)
@@ -27,56 +50,54 @@ def analyze_convergence(file_path, threshold_percent=1.0):
         dict: Results containing convergence information
     """
     try:
-        # Read the data
-        data = np.loadtxt(file_path)
-        
-        if data.shape[1] != 4:
-            raise ValueError(f"Expected 4 columns, got {data.shape[1]}")
-        
-        communications = data[:, 0]
-        residual = data[:, 1]
-        ape = data[:, 2]  # Position errors
-        ate = data[:, 3]  # Rotation errors
-        
-        # Get final values (last row)
-        final_ape = ape[-1]
-        final_ate = ate[-1]
-        final_residual = residual[-1]
-        
-        print(f"Final values:")
-        print(f"  Communications: {int(communications[-1])}")
-        print(f"  Residual: {final_residual:.6f}")
-        print(f"  APE (Position): {final_ape:.6f}")
-        print(f"  ATE (Rotation): {final_ate:.6f}")
-        print()
-        
-        # Calculate threshold values
-        threshold_factor = threshold_percent / 100.0
-        ape_threshold = final_ape * (1 + threshold_factor)
-        ate_threshold = final_ate * (1 + threshold_factor)
-        
-        print(f"Threshold values ({threshold_percent}% above final):")
-        print(f"  APE threshold: {ape_threshold:.6f}")
-        print(f"  ATE threshold: {ate_threshold:.6f}")
-        print()
-        
-        # Find when APE reaches within threshold
-        ape_converged_idx = np.where(ape <= ape_threshold)[0]
-        ape_convergence_comm = None
-        if len(ape_converged_idx) > 0:
-            ape_convergence_comm = int(communications[ape_converged_idx[0]])
-        
-        # Find when ATE reaches within threshold
-        ate_converged_idx = np.where(ate <= ate_threshold)[0]
-        ate_convergence_comm = None
-        if len(ate_converged_idx) > 0:
-            ate_convergence_comm = int(communications[ate_converged_idx[0]])
-        
-        # Find when both reach within threshold
-        both_converged_idx = np.where((ape <= ape_threshold) & (ate <= ate_threshold))[0]
-        both_convergence_comm = None
-        if len(both_converged_idx) > 0:
-            both_convergence_comm = int(communications[both_converged_idx[0]])
+        with open(file_path, 'rb', buffering=READ_BUFFER) as f:
+            # Get final values (last row)
+            final_row = read_final_row(f)
+            
+            if final_row is None:
+                raise ValueError("File contains no data")
+            if len(final_row) != 4:
+                raise ValueError(f"Expected 4 columns, got {len(final_row)}")
+            
+            final_communications, final_residual, final_ape, final_ate = final_row
+            
+            print(f"Final values:")
+            print(f"  Communications: {int(final_communications)}")
+            print(f"  Residual: {final_residual:.6f}")
+            print(f"  APE (Position): {final_ape:.6f}")
+            print(f"  ATE (Rotation): {final_ate:.6f}")
+            print()
+            
+            # Calculate threshold values
+            threshold_factor = threshold_percent / 100.0
+            ape_threshold = final_ape * (1 + threshold_factor)
+            ate_threshold = final_ate * (1 + threshold_factor)
+            
+            print(f"Threshold values ({threshold_percent}% above final):")
+            print(f"  APE threshold: {ape_threshold:.6f}")
+            print(f"  ATE threshold: {ate_threshold:.6f}")
+            print()
+            
+            # Stream forward to find the first row where APE, ATE and both are
+            # within threshold; once both are, the other two are known as well
+            ape_convergence_comm = None
+            ate_convergence_comm = None
+            both_convergence_comm = None
+            
+            f.seek(0)
+            for line in f:
+                columns = line.split()
+                if not columns:
+                    continue
+                ape_ok = float(columns[2]) <= ape_threshold
+                ate_ok = float(columns[3]) <= ate_threshold
+                if ape_convergence_comm is None and ape_ok:
+                    ape_convergence_comm = int(float(columns[0]))
+                if ate_convergence_comm is None and ate_ok:
+                    ate_convergence_comm = int(float(columns[0]))
+                if ape_ok and ate_ok:
+                    both_convergence_comm = int(float(columns[0]))
+                    break
         
         # Print results
         print("Convergence analysis:")
@@ -96,7 +117,7 @@ def analyze_convergence(file_path, threshold_percent=1.0):
             print(f"  Both APE and ATE never simultaneously reach within {threshold_percent}% of final values")
         
         # Calculate percentage of total communications
-        total_comm = int(communications[-1])
+        total_comm = int(final_communications)
         if both_convergence_comm is not None:
             percentage = (both_convergence_comm / total_comm) * 100
             print(f"  This represents {percentage:.1f}% of total communications")
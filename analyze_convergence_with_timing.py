@@ -8,64 +8,153 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
 import os
+import sys
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def extract_robot_count(grid_size_str):
-    """Extract robot count from grid size string like '15_15' -> 15"""
-    if pd.isna(grid_size_str):
-        return None
-    parts = grid_size_str.split('_')
-    if len(parts) >= 2:
-        return int(parts[0])
-    return None
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    # pyarrow is optional; iter_time files are parsed with pandas otherwise
+    pa = None
+
+try:
+    from tsdownsample import LTTBDownsampler
+except ImportError:
+    # tsdownsample is optional; lines are plotted with every point otherwise
+    LTTBDownsampler = None
+
+ITER_TIME_COLUMNS = ['iteration', 'total_time', 'total_communications']
+
+# Known column types of convergence_analysis_results.csv. The communication
+# counts are left to inference: they are NaN for runs that never converged
+RESULTS_DTYPES = {
+    'file_path': str,
+    'experiment_name': str,
+    'algorithm': 'category',  # few distinct values, used for grouping
+    'grid_size': str,
+    'final_position_error': 'float64',
+    'final_rotation_error': 'float64',
+    'position_convergence_ratio': 'float64',
+    'rotation_convergence_ratio': 'float64'
+}
+
+# Threads used to read the iter_time_comm.txt files concurrently
+MAX_READ_WORKERS = 16
+
+def _skip_comment_row(row):
+    """
+    pyarrow invalid row handler: skip comment lines such as the
+    "# iteration total_time total_communications" header, which has an extra
+    field, and fail on any other malformed row so the file is read with pandas.
+    """
+    return 'skip' if row.text.lstrip().startswith('#') else 'error'
+
+@functools.lru_cache(maxsize=None)
+def _load_iter(iter_time_file):
+    """
+    Parse an iter_time_comm.txt file, using pyarrow's multithreaded reader when available.
+    
+    The result is cached per path and must not be modified by callers.
+    
+    Returns:
+        tuple: (iteration, total_time, total_communications) numpy arrays
+    """
+    if pa is not None:
+        try:
+            table = pacsv.read_csv(
+                iter_time_file,
+                read_options=pacsv.ReadOptions(column_names=ITER_TIME_COLUMNS),
+                parse_options=pacsv.ParseOptions(delimiter=' ', invalid_row_handler=_skip_comment_row),
+                convert_options=pacsv.ConvertOptions(column_types={
+                    'iteration': pa.int64(), 'total_time': pa.float64(),
+                    'total_communications': pa.int64()}))
+            return tuple(table.column(name).to_numpy() for name in ITER_TIME_COLUMNS)
+        except pa.ArrowInvalid:
+            # e.g. repeated or trailing spaces; let pandas handle it
+            pass
+    iter_data = pd.read_csv(iter_time_file, sep=r'\s+', comment='#', header=None,
+                            names=ITER_TIME_COLUMNS, engine='c',
+                            dtype={'iteration': 'int64', 'total_time': 'float64',
+                                   'total_communications': 'float64'})
+    return tuple(iter_data[name].to_numpy() for name in ITER_TIME_COLUMNS)
 
-def find_convergence_iteration_and_time(iter_time_file, convergence_comm, use_final=False):
+def load_iter_time_data(experiment_names, results_dir):
+    """
+    Read the iter_time_comm.txt file of every experiment.
+    
+    Args:
+        experiment_names: Experiment folder names inside results_dir
+        results_dir: Directory containing the experiment folders
+        
+    Returns:
+        dict: Experiment name -> output of _load_iter, for the files that could be read
+    """
+    paths = {}
+    for folder_name in experiment_names:
+        print(f"Processing {folder_name}...")
+        paths[folder_name] = Path(results_dir) / folder_name / "iter_time_comm.txt"
+    
+    # Overlap the file reads; each file is parsed once however often it is queried.
+    # Missing files are found by the read itself rather than a separate stat
+    with ThreadPoolExecutor(max_workers=MAX_READ_WORKERS) as ex:
+        futures = {folder_name: ex.submit(_load_iter, path) for folder_name, path in paths.items()}
+    
+    iter_data = {}
+    for folder_name, future in futures.items():
+        try:
+            iter_data[folder_name] = future.result()
+        except (FileNotFoundError, pd.errors.EmptyDataError):
+            # No timing data for this experiment
+            continue
+        except Exception as e:
+            print(f"Error reading {paths[folder_name]}: {e}")
+    return iter_data
+
+def find_convergence_iteration_and_time(iter_data, convergence_comm, use_final=False):
     """
     Find the iteration number and runtime when convergence communication is reached.
     
     Args:
-        iter_time_file: Path to iter_time_comm.txt file
+        iter_data: Arrays returned by _load_iter, or None if the file is missing
         convergence_comm: Communication count at convergence
         use_final: If True, return final values instead of convergence values
         
     Returns:
-        tuple: (iteration, runtime) or (None, None) if not found
+        tuple: (iteration, runtime) or (NaN, NaN) if not found
     """
-    if not os.path.exists(iter_time_file):
-        return None, None
-        
-    try:
-        # Read the iter_time_comm.txt file
-        iter_data = pd.read_csv(iter_time_file, sep='\s+', comment='#', header=None,
-                               names=['iteration', 'total_time', 'total_communications'])
-        
-        if len(iter_data) == 0:
-            return None, None
-            
-        # If use_final is True or convergence_comm is invalid, return final values
-        if use_final or pd.isna(convergence_comm) or convergence_comm == 0:
-            final_row = iter_data.iloc[-1]
-            return final_row['iteration'], final_row['total_time']
-        
-        # Find the row where total_communications is closest to (but >= ) convergence_comm
-        valid_rows = iter_data[iter_data['total_communications'] >= convergence_comm]
-        
-        if len(valid_rows) == 0:
-            # If no row meets the convergence communication, return final values
-            final_row = iter_data.iloc[-1]
-            return final_row['iteration'], final_row['total_time']
-            
-        # Get the first row that meets or exceeds the convergence communication count
-        closest_row = valid_rows.iloc[0]
-        return closest_row['iteration'], closest_row['total_time']
-        
-    except Exception as e:
-        print(f"Error reading {iter_time_file}: {e}")
-        return None, None
+    if iter_data is None or len(iter_data[0]) == 0:
+        return np.nan, np.nan
+    iteration, total_time, total_communications = iter_data
+    
+    # If use_final is True or convergence_comm is invalid, return final values
+    if use_final or pd.isna(convergence_comm) or convergence_comm <= 0:
+        return iteration[-1], total_time[-1]
+    
+    # total_communications only grows, so binary search for the first row that
+    # meets or exceeds the convergence communication count
+    idx = np.searchsorted(total_communications, convergence_comm, side='left')
+    if idx == len(total_communications):
+        # If no row meets the convergence communication, return final values
+        idx = -1
+    return iteration[idx], total_time[idx]
+
+def _up_to_date(inputs, outputs):
+    """Return True if every output exists and is at least as new as every input."""
+    if not all(os.path.exists(path) for path in inputs):
+        return False
+    newest_input = max(os.path.getmtime(path) for path in inputs)
+    return all(os.path.exists(path) and os.path.getmtime(path) >= newest_input for path in outputs)
 
 def analyze_convergence_with_timing(results_dir="data/results/seq"):
     """
     Enhanced convergence analysis that includes iteration and timing information.
+    
+    Returns:
+        tuple: (enhanced DataFrame, paths of the iter_time_comm.txt files that
+        were read), or None if the inputs are missing
     """
     if not os.path.exists(results_dir):
         print(f"Results directory {results_dir} not found!")
@@ -76,76 +165,90 @@ def analyze_convergence_with_timing(results_dir="data/results/seq"):
         print("convergence_analysis_results.csv not found! Run analyze_all_convergence.py first.")
         return None
         
-    df = pd.read_csv('convergence_analysis_results.csv')
-    
-    # Add new columns for iteration and timing information
-    df['position_convergence_iteration'] = None
-    df['position_convergence_time'] = None
-    df['rotation_convergence_iteration'] = None
-    df['rotation_convergence_time'] = None
+    df = pd.read_csv('convergence_analysis_results.csv', dtype=RESULTS_DTYPES)
     
     print("Analyzing timing and iteration data...")
     
-    for idx, row in df.iterrows():
-        # Extract folder path from the experiment name
-        folder_name = row['experiment_name']
-        folder_path = os.path.join(results_dir, folder_name)
-        iter_time_file = os.path.join(folder_path, "iter_time_comm.txt")
-        
-        print(f"Processing {folder_name}...")
-        
-        # Get position convergence timing
-        if pd.notna(row['position_convergence_comm']) and row['position_convergence_comm'] > 0:
-            # Method converged, use convergence point
-            pos_iter, pos_time = find_convergence_iteration_and_time(
-                iter_time_file, row['position_convergence_comm'], use_final=False)
-        else:
-            # Method failed to converge, use final values
-            pos_iter, pos_time = find_convergence_iteration_and_time(
-                iter_time_file, None, use_final=True)
-            
-        df.at[idx, 'position_convergence_iteration'] = pos_iter
-        df.at[idx, 'position_convergence_time'] = pos_time
-            
-        # Get rotation convergence timing
-        if pd.notna(row['rotation_convergence_comm']) and row['rotation_convergence_comm'] > 0:
-            # Method converged, use convergence point
-            rot_iter, rot_time = find_convergence_iteration_and_time(
-                iter_time_file, row['rotation_convergence_comm'], use_final=False)
-        else:
-            # Method failed to converge, use final values
-            rot_iter, rot_time = find_convergence_iteration_and_time(
-                iter_time_file, None, use_final=True)
-            
-        df.at[idx, 'rotation_convergence_iteration'] = rot_iter
-        df.at[idx, 'rotation_convergence_time'] = rot_time
+    iter_data = load_iter_time_data(df['experiment_name'], results_dir)
+    
+    # Preallocate the timing columns; entries without iter_time data stay NaN
+    pos_iter = np.full(len(df), np.nan)
+    pos_time = np.full(len(df), np.nan)
+    rot_iter = np.full(len(df), np.nan)
+    rot_time = np.full(len(df), np.nan)
+    
+    for i, (name, pos_comm, rot_comm) in enumerate(zip(
+            df['experiment_name'], df['position_convergence_comm'], df['rotation_convergence_comm'])):
+        if name not in iter_data:
+            continue
+        # Methods that failed to converge get the final values
+        pos_iter[i], pos_time[i] = find_convergence_iteration_and_time(iter_data[name], pos_comm)
+        rot_iter[i], rot_time[i] = find_convergence_iteration_and_time(iter_data[name], rot_comm)
     
-    # Extract robot count
-    df['robot_count'] = df['grid_size'].apply(extract_robot_count)
+    df = df.assign(position_convergence_iteration=pos_iter, position_convergence_time=pos_time,
+                   rotation_convergence_iteration=rot_iter, rotation_convergence_time=rot_time)
+    
+    # Extract robot count from grid size strings like '15_15' -> 15
+    grid_parts = df['grid_size'].astype(str).str.split('_')
+    df['robot_count'] = pd.to_numeric(grid_parts.str[0].where(grid_parts.str.len() >= 2), errors='coerce')
     df = df.dropna(subset=['robot_count']).sort_values('robot_count')
     
     # Save enhanced results
     df.to_csv('enhanced_convergence_analysis.csv', index=False)
     print(f"Enhanced analysis saved to: enhanced_convergence_analysis.csv")
+    # Typed copy for faster loading in create_ieee_plots.py
+    try:
+        df.to_parquet('enhanced_convergence_analysis.parquet', index=False)
+    except ImportError:
+        # parquet support (pyarrow) is optional; readers fall back to the CSV
+        pass
+    
+    # The files that were read are known from the reads themselves
+    iter_time_files = [Path(results_dir) / name / "iter_time_comm.txt" for name in iter_data]
+    return df, iter_time_files
+
+def _lttb(x, y, n_out=1000):
+    """
+    Downsample a line to n_out points with LTTB (largest triangle three buckets).
     
-    return df
+    Lines that already have at most n_out points, or that cannot be downsampled
+    because tsdownsample is not installed, are returned unchanged.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if LTTBDownsampler is None or len(x) <= n_out:
+        return x, y
+    idx = LTTBDownsampler().downsample(x, y, n_out=n_out)
+    return x[idx], y[idx]
 
 def plot_convergence_analysis(df):
     """Create comprehensive plots of convergence analysis including timing."""
     
     # Set up the plotting style
     plt.style.use('default')
+    # Drop sub-pixel path segments and rasterize long paths in chunks
+    plt.rcParams.update({
+        'path.simplify': True,
+        'path.simplify_threshold': 1.0,
+        'agg.path.chunksize': 10000
+    })
     colors = {'asapp': 'red', 'dgs': 'blue', 'geodesic-mesa': 'green'}
     
+    # Split by algorithm once and reuse the groups for every subplot
+    groups = dict(list(df.groupby('algorithm', sort=False, observed=True)))
+    
     # Create a large figure with multiple subplots
-    fig, axes = plt.subplots(3, 3, figsize=(18, 15))
+    # constrained_layout lays the panels out while drawing, without tight_layout's extra draw
+    fig, axes = plt.subplots(3, 3, figsize=(18, 15), constrained_layout=True)
     fig.suptitle('Enhanced Convergence Analysis vs. Number of Robots', fontsize=16, fontweight='bold')
     
+    # No line needs more than about two points per pixel of figure width
+    n_out = int(2 * fig.get_size_inches()[0] * fig.dpi)
+    
     # Plot 1: Total Communications vs Robot Count
     ax = axes[0, 0]
-    for algorithm in df['algorithm'].unique():
-        alg_data = df[df['algorithm'] == algorithm]
-        ax.plot(alg_data['robot_count'], alg_data['total_communications'], 
+    for algorithm, alg_data in groups.items():
+        ax.plot(*_lttb(alg_data['robot_count'], alg_data['total_communications'], n_out=n_out), 
                 'o-', label=algorithm, color=colors.get(algorithm, 'black'), linewidth=2, markersize=6)
     ax.set_xlabel('Number of Robots')
     ax.set_ylabel('Total Communications')
@@ -156,11 +259,10 @@ def plot_convergence_analysis(df):
     
     # Plot 2: Position Convergence Communications vs Robot Count
     ax = axes[0, 1]
-    for algorithm in df['algorithm'].unique():
-        alg_data = df[df['algorithm'] == algorithm]
+    for algorithm, alg_data in groups.items():
         valid_data = alg_data.dropna(subset=['position_convergence_comm'])
         if len(valid_data) > 0:
-            ax.plot(valid_data['robot_count'], valid_data['position_convergence_comm'], 
+            ax.plot(*_lttb(valid_data['robot_count'], valid_data['position_convergence_comm'], n_out=n_out), 
                     'o-', label=algorithm, color=colors.get(algorithm, 'black'), linewidth=2, markersize=6)
     ax.set_xlabel('Number of Robots')
     ax.set_ylabel('Communications to Convergence')
@@ -171,11 +273,10 @@ def plot_convergence_analysis(df):
     
     # Plot 3: Position Convergence Iterations vs Robot Count
     ax = axes[0, 2]
-    for algorithm in df['algorithm'].unique():
-        alg_data = df[df['algorithm'] == algorithm]
+    for algorithm, alg_data in groups.items():
         valid_data = alg_data.dropna(subset=['position_convergence_iteration'])
         if len(valid_data) > 0:
-            ax.plot(valid_data['robot_count'], valid_data['position_convergence_iteration'], 
+            ax.plot(*_lttb(valid_data['robot_count'], valid_data['position_convergence_iteration'], n_out=n_out), 
                     'o-', label=algorithm, color=colors.get(algorithm, 'black'), linewidth=2, markersize=6)
     ax.set_xlabel('Number of Robots')
     ax.set_ylabel('Iterations to Convergence')
@@ -185,11 +286,10 @@ def plot_convergence_analysis(df):
     
     # Plot 4: Position Convergence Time vs Robot Count
     ax = axes[1, 0]
-    for algorithm in df['algorithm'].unique():
-        alg_data = df[df['algorithm'] == algorithm]
+    for algorithm, alg_data in groups.items():
         valid_data = alg_data.dropna(subset=['position_convergence_time'])
         if len(valid_data) > 0:
-            ax.plot(valid_data['robot_count'], valid_data['position_convergence_time'], 
+            ax.plot(*_lttb(valid_data['robot_count'], valid_data['position_convergence_time'], n_out=n_out), 
                     'o-', label=algorithm, color=colors.get(algorithm, 'black'), linewidth=2, markersize=6)
     ax.set_xlabel('Number of Robots')
     ax.set_ylabel('Time to Convergence (s)')
@@ -200,11 +300,10 @@ def plot_convergence_analysis(df):
     
     # Plot 5: Convergence Efficiency (% of total) vs Robot Count
     ax = axes[1, 1]
-    for algorithm in df['algorithm'].unique():
-        alg_data = df[df['algorithm'] == algorithm]
+    for algorithm, alg_data in groups.items():
         valid_data = alg_data.dropna(subset=['position_convergence_ratio'])
         if len(valid_data) > 0:
-            ax.plot(valid_data['robot_count'], valid_data['position_convergence_ratio'] * 100, 
+            ax.plot(*_lttb(valid_data['robot_count'], valid_data['position_convergence_ratio'] * 100, n_out=n_out), 
                     'o-', label=algorithm, color=colors.get(algorithm, 'black'), linewidth=2, markersize=6)
     ax.set_xlabel('Number of Robots')
     ax.set_ylabel('Convergence Efficiency (%)')
@@ -215,11 +314,12 @@ def plot_convergence_analysis(df):
     
     # Plot 6: Final Position Error vs Robot Count
     ax = axes[1, 2]
-    for algorithm in df['algorithm'].unique():
-        alg_data = df[df['algorithm'] == algorithm]
-        valid_data = alg_data[alg_data['final_position_error'] < 1000]  # Filter outliers
-        if len(valid_data) > 0:
-            ax.plot(valid_data['robot_count'], valid_data['final_position_error'], 
+    df_finite = df[df['final_position_error'] < 1000]  # Filter outliers
+    groups_finite = dict(list(df_finite.groupby('algorithm', sort=False, observed=True)))
+    for algorithm in groups:
+        valid_data = groups_finite.get(algorithm)
+        if valid_data is not None:
+            ax.plot(*_lttb(valid_data['robot_count'], valid_data['final_position_error'], n_out=n_out), 
                     'o-', label=algorithm, color=colors.get(algorithm, 'black'), linewidth=2, markersize=6)
     ax.set_xlabel('Number of Robots')
     ax.set_ylabel('Final Position Error')
@@ -230,12 +330,11 @@ def plot_convergence_analysis(df):
     
     # Plot 7: Communication efficiency (comm/iteration) at convergence
     ax = axes[2, 0]
-    for algorithm in df['algorithm'].unique():
-        alg_data = df[df['algorithm'] == algorithm]
+    for algorithm, alg_data in groups.items():
         valid_data = alg_data.dropna(subset=['position_convergence_comm', 'position_convergence_iteration'])
         if len(valid_data) > 0:
             comm_per_iter = valid_data['position_convergence_comm'] / valid_data['position_convergence_iteration']
-            ax.plot(valid_data['robot_count'], comm_per_iter, 
+            ax.plot(*_lttb(valid_data['robot_count'], comm_per_iter, n_out=n_out), 
                     'o-', label=algorithm, color=colors.get(algorithm, 'black'), linewidth=2, markersize=6)
     ax.set_xlabel('Number of Robots')
     ax.set_ylabel('Communications per Iteration')
@@ -246,12 +345,11 @@ def plot_convergence_analysis(df):
     
     # Plot 8: Time efficiency (time/iteration) at convergence
     ax = axes[2, 1]
-    for algorithm in df['algorithm'].unique():
-        alg_data = df[df['algorithm'] == algorithm]
+    for algorithm, alg_data in groups.items():
         valid_data = alg_data.dropna(subset=['position_convergence_time', 'position_convergence_iteration'])
         if len(valid_data) > 0:
             time_per_iter = valid_data['position_convergence_time'] / valid_data['position_convergence_iteration']
-            ax.plot(valid_data['robot_count'], time_per_iter, 
+            ax.plot(*_lttb(valid_data['robot_count'], time_per_iter, n_out=n_out), 
                     'o-', label=algorithm, color=colors.get(algorithm, 'black'), linewidth=2, markersize=6)
     ax.set_xlabel('Number of Robots')
     ax.set_ylabel('Time per Iteration (s)')
@@ -261,8 +359,7 @@ def plot_convergence_analysis(df):
     
     # Plot 9: Iterations vs Communications scaling at convergence
     ax = axes[2, 2]
-    for algorithm in df['algorithm'].unique():
-        alg_data = df[df['algorithm'] == algorithm]
+    for algorithm, alg_data in groups.items():
         valid_data = alg_data.dropna(subset=['position_convergence_comm', 'position_convergence_iteration'])
         if len(valid_data) > 0:
             ax.scatter(valid_data['position_convergence_iteration'], valid_data['position_convergence_comm'], 
@@ -275,7 +372,6 @@ def plot_convergence_analysis(df):
     ax.set_xscale('log')
     ax.set_yscale('log')
     
-    plt.tight_layout()
     plt.savefig('enhanced_convergence_analysis.png', dpi=300, bbox_inches='tight')
     print("Saved: enhanced_convergence_analysis.png")
     plt.close()
@@ -285,47 +381,62 @@ def print_summary_statistics(df):
     print("\nEnhanced Summary Statistics by Algorithm:")
     print("=" * 80)
     
-    for algorithm in sorted(df['algorithm'].unique()):
-        alg_data = df[df['algorithm'] == algorithm]
+    # All per-algorithm reductions in one pass; min/max/mean skip NaNs, so a
+    # NaN minimum means the algorithm has no valid values for that column
+    stats = df.groupby('algorithm', sort=True, observed=True).agg(
+        robot_counts=('robot_count', 'unique'),
+        total_comm_min=('total_communications', 'min'),
+        total_comm_max=('total_communications', 'max'),
+        conv_comm_min=('position_convergence_comm', 'min'),
+        conv_comm_max=('position_convergence_comm', 'max'),
+        conv_iter_min=('position_convergence_iteration', 'min'),
+        conv_iter_max=('position_convergence_iteration', 'max'),
+        conv_time_min=('position_convergence_time', 'min'),
+        conv_time_max=('position_convergence_time', 'max'),
+        conv_ratio_mean=('position_convergence_ratio', 'mean')
+    )
+    
+    for algorithm, row in stats.iterrows():
         print(f"\n{algorithm.upper()}:")
-        print(f"  Robot counts tested: {sorted(alg_data['robot_count'].unique())}")
+        print(f"  Robot counts tested: {sorted(row['robot_counts'])}")
         
         # Communication statistics
-        print(f"  Total communications range: {alg_data['total_communications'].min():.0f} - {alg_data['total_communications'].max():.0f}")
+        print(f"  Total communications range: {row['total_comm_min']:.0f} - {row['total_comm_max']:.0f}")
         
         # Convergence communication statistics
-        valid_comm = alg_data.dropna(subset=['position_convergence_comm'])
-        if len(valid_comm) > 0:
-            print(f"  Convergence communications range: {valid_comm['position_convergence_comm'].min():.0f} - {valid_comm['position_convergence_comm'].max():.0f}")
+        if pd.notna(row['conv_comm_min']):
+            print(f"  Convergence communications range: {row['conv_comm_min']:.0f} - {row['conv_comm_max']:.0f}")
         
         # Convergence iteration statistics
-        valid_iter = alg_data.dropna(subset=['position_convergence_iteration'])
-        if len(valid_iter) > 0:
-            print(f"  Convergence iterations range: {valid_iter['position_convergence_iteration'].min():.0f} - {valid_iter['position_convergence_iteration'].max():.0f}")
+        if pd.notna(row['conv_iter_min']):
+            print(f"  Convergence iterations range: {row['conv_iter_min']:.0f} - {row['conv_iter_max']:.0f}")
             
         # Convergence time statistics
-        valid_time = alg_data.dropna(subset=['position_convergence_time'])
-        if len(valid_time) > 0:
-            print(f"  Convergence time range: {valid_time['position_convergence_time'].min():.1f}s - {valid_time['position_convergence_time'].max():.1f}s")
+        if pd.notna(row['conv_time_min']):
+            print(f"  Convergence time range: {row['conv_time_min']:.1f}s - {row['conv_time_max']:.1f}s")
             
         # Efficiency statistics
-        valid_eff = alg_data.dropna(subset=['position_convergence_ratio'])
-        if len(valid_eff) > 0:
-            print(f"  Average convergence efficiency: {valid_eff['position_convergence_ratio'].mean():.1%}")
+        if pd.notna(row['conv_ratio_mean']):
+            print(f"  Average convergence efficiency: {row['conv_ratio_mean']:.1%}")
 
 def main():
     # Analyze convergence with timing information
-    df = analyze_convergence_with_timing()
+    result = analyze_convergence_with_timing()
     
-    if df is None:
+    if result is None:
         return
+    df, iter_time_files = result
         
     print(f"\nEnhanced analysis completed for {len(df)} experiments")
     print(f"Algorithms: {sorted(df['algorithm'].unique())}")
     print(f"Robot counts: {sorted(df['robot_count'].unique())}")
     
-    # Create plots
-    plot_convergence_analysis(df)
+    # Create plots, unless they are newer than all of their inputs
+    plot_inputs = ['convergence_analysis_results.csv', __file__, *iter_time_files]
+    if _up_to_date(plot_inputs, ['enhanced_convergence_analysis.png']):
+        print("enhanced_convergence_analysis.png is up to date")
+    else:
+        plot_convergence_analysis(df)
     
     # Print summary statistics
     print_summary_statistics(df)
@@ -340,7 +451,8 @@ def main():
     
     print(f"\nDetailed Summary Table:")
     print("=" * 120)
-    print(summary_df.to_string(index=False))
+    # Stream the rows as tab-separated values instead of rendering one big string
+    summary_df.to_csv(sys.stdout, sep='\t', index=False, na_rep='NaN')
     
     # Save summary
     summary_df.to_csv('convergence_summary_with_timing.csv', index=False)
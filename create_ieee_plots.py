@@ -3,11 +3,59 @@
 Create IEEE-style plots with proper font fallback
 """
 
+import os
+import sys
+import matplotlib
 import pandas as pd
-import matplotlib.pyplot as plt
 import numpy as np
 
+# Without a display (e.g. batch runs on a server) render with Agg instead of
+# starting a GUI backend; an explicit MPLBACKEND still wins
+HEADLESS = sys.platform.startswith('linux') and not (
+    os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))
+if HEADLESS and 'MPLBACKEND' not in os.environ:
+    matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt
+
+INPUT_CSV = 'enhanced_convergence_analysis.csv'
+INPUT_PARQUET = 'enhanced_convergence_analysis.parquet'
+OUTPUT_FILES = ['position_convergence_ieee.png', 'scalability.pdf']
+
+def _up_to_date(inputs, outputs):
+    """Return True if every output exists and is at least as new as every input."""
+    if not all(os.path.exists(path) for path in inputs):
+        return False
+    newest_input = max(os.path.getmtime(path) for path in inputs)
+    return all(os.path.exists(path) and os.path.getmtime(path) >= newest_input for path in outputs)
+
+def load_enhanced_analysis():
+    """
+    Load the enhanced analysis, preferring the parquet copy written next to the CSV.
+    
+    The parquet file is only used if it is at least as new as the CSV, since
+    add_manual_stats.py appends to the CSV alone.
+    
+    Returns:
+        DataFrame or None if the CSV does not exist
+    """
+    try:
+        if os.path.getmtime(INPUT_PARQUET) >= os.path.getmtime(INPUT_CSV):
+            return pd.read_parquet(INPUT_PARQUET)
+    except (OSError, ImportError):
+        # No (current) parquet copy or no parquet support; read the CSV
+        pass
+    try:
+        return pd.read_csv(INPUT_CSV, dtype={'algorithm': 'category'})
+    except FileNotFoundError:
+        return None
+
 def main():
+    # Nothing to do if the plots are newer than the data and this script
+    if _up_to_date([INPUT_CSV, __file__], OUTPUT_FILES):
+        print(f"Plots are up to date with {INPUT_CSV}")
+        return
+    
     # Set up IEEE plotting style with font fallback
     plt.rcParams.update({
         'font.family': 'serif',
@@ -26,10 +74,9 @@ def main():
     })
     
     # Load data
-    try:
-        df = pd.read_csv('enhanced_convergence_analysis.csv')
-    except FileNotFoundError:
-        print("enhanced_convergence_analysis.csv not found!")
+    df = load_enhanced_analysis()
+    if df is None:
+        print(f"{INPUT_CSV} not found!")
         return
     
     df = df.dropna(subset=['robot_count']).sort_values('robot_count')
@@ -50,22 +97,73 @@ def main():
     create_original_plots(df, colors, markers, legend_override)
     create_normalized_plots(df, colors, markers, legend_override)
 
-def create_original_plots(df, colors, markers, legend_override=None):
-    """Create plots showing absolute metrics vs robot count"""
-    fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(3.5, 4.5), sharex=True)
+# Figures kept between calls when imported as a module: key -> (fig, {algorithm: lines})
+_FIG_CACHE = {}
+
+def _original_series(algo_data):
+    """Y values of the three original subplots for one algorithm"""
+    return [algo_data['position_convergence_comm'],
+            algo_data['position_convergence_iteration'],
+            algo_data['position_convergence_time']]
+
+def _normalized_series(algo_data):
+    """Y values of the three normalized (per robot) subplots for one algorithm"""
+    robot_count = algo_data['robot_count'].to_numpy(dtype=float)
+    return [series.to_numpy(dtype=float) / robot_count for series in _original_series(algo_data)]
+
+def _cached_figure(key, groups):
+    """Return the cached (fig, lines) for key if it is still open and has the same algorithms"""
+    cached = _FIG_CACHE.get(key)
+    if cached is None:
+        return None
+    fig, lines = cached
+    if not plt.fignum_exists(fig.number) or list(lines) != list(groups):
+        del _FIG_CACHE[key]
+        return None
+    return cached
+
+def _align_x(axes):
+    """
+    Give the stacked axes the same robot count ticks and x range, with tick
+    labels on the bottom axis only. Done once instead of sharing the x axis,
+    which would keep the axes synchronized on every draw.
+    """
+    for ax in axes:
+        # Set x-axis ticks to include start and end points
+        ax.set_xticks(range(5, 16))  # 5 to 15 inclusive
+    xmin = min(ax.get_xlim()[0] for ax in axes)
+    xmax = max(ax.get_xlim()[1] for ax in axes)
+    for ax in axes:
+        ax.set_xlim(xmin, xmax)
+    for ax in axes[:-1]:
+        ax.tick_params(labelbottom=False)
+
+def _update_lines(fig, lines, groups, series_fn):
+    """Point the existing line artists at new data and rescale the axes"""
+    for algo, algo_data in groups.items():
+        for line, y in zip(lines[algo], series_fn(algo_data)):
+            line.set_data(algo_data['robot_count'], y)
+    for ax in fig.axes:
+        ax.relim()
+        ax.autoscale_view()
+    # Autoscaling drops the fixed ticks, which also widen the x range
+    _align_x(fig.axes)
+
+def _build_original(groups, colors, markers, legend_override=None):
+    """Build the absolute metrics figure, returning it with its line artists"""
+    fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(3.5, 4.5), constrained_layout=True)
+    lines = {algo: [] for algo in groups}
     
     # Store line objects for legend
     legend_lines = []
     legend_labels = []
     
     # Plot Communications vs Robots
-    for algo in df['algorithm'].unique():
-        if pd.isna(algo):
-            continue
-        algo_data = df[df['algorithm'] == algo]
+    for algo, algo_data in groups.items():
         line = ax1.plot(algo_data['robot_count'], algo_data['position_convergence_comm'], 
                        color=colors[algo], marker=markers[algo], 
                        linewidth=1.5, markersize=4, label=algo)
+        lines[algo].append(line[0])
         
         # Only add to legend once per algorithm
         if algo not in [label for label in legend_labels]:
@@ -77,110 +175,114 @@ def create_original_plots(df, colors, markers, legend_override=None):
     ax1.grid(True, alpha=0.3)
     
     # Plot Iterations vs Robots
-    for algo in df['algorithm'].unique():
-        if pd.isna(algo):
-            continue
-        algo_data = df[df['algorithm'] == algo]
-        ax2.plot(algo_data['robot_count'], algo_data['position_convergence_iteration'], 
+    for algo, algo_data in groups.items():
+        line = ax2.plot(algo_data['robot_count'], algo_data['position_convergence_iteration'], 
                 color=colors[algo], marker=markers[algo], 
                 linewidth=1.5, markersize=4)
+        lines[algo].append(line[0])
     
     ax2.set_ylabel('Iterations')
     ax2.grid(True, alpha=0.3)
     
     # Plot Time vs Robots
-    for algo in df['algorithm'].unique():
-        if pd.isna(algo):
-            continue
-        algo_data = df[df['algorithm'] == algo]
-        ax3.plot(algo_data['robot_count'], algo_data['position_convergence_time'], 
+    for algo, algo_data in groups.items():
+        line = ax3.plot(algo_data['robot_count'], algo_data['position_convergence_time'], 
                 color=colors[algo], marker=markers[algo], 
                 linewidth=1.5, markersize=4)
+        lines[algo].append(line[0])
     
     ax3.set_xlabel('Number of Robots')
     ax3.set_ylabel('Time (s)')
     ax3.grid(True, alpha=0.3)
     
-    # Set x-axis ticks to include start and end points
-    ax3.set_xticks(range(5, 16))  # 5 to 15 inclusive
+    _align_x([ax1, ax2, ax3])
     
     # Add shared legend at the bottom
     fig.legend(legend_lines, legend_labels, loc='lower center', 
                bbox_to_anchor=(0.5, -0.02), ncol=len(legend_labels), 
                fontsize=7, frameon=False)
     
-    plt.tight_layout()
-    plt.subplots_adjust(bottom=0.08)  # Make room for legend
-    plt.savefig('position_convergence_ieee.png', dpi=300, bbox_inches='tight')
-    plt.show()
-    print("Original plots saved as 'position_convergence_ieee.png'")
+    fig.get_layout_engine().set(rect=(0, 0.08, 1, 0.92))  # Make room for legend
+    return fig, lines
 
-def create_normalized_plots(df, colors, markers, legend_override=None):
-    """Create plots showing normalized metrics vs robot count"""
-    fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(3.5, 3.9), sharex=True)
+def _build_normalized(groups, colors, markers, legend_override=None):
+    """Build the normalized metrics figure, returning it with its line artists"""
+    fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(3.5, 3.9), constrained_layout=True)
+    lines = {algo: [] for algo in groups}
     
     # Store line objects for legend
     legend_lines = []
     legend_labels = []
     
-    # Plot Communications per Robot vs Robots
-    for algo in df['algorithm'].unique():
-        if pd.isna(algo):
-            continue
-        algo_data = df[df['algorithm'] == algo]
-        comm_per_robot = algo_data['position_convergence_comm'] / algo_data['robot_count']
-        line = ax1.plot(algo_data['robot_count'], comm_per_robot, 
-                       color=colors[algo], marker=markers[algo], 
-                       linewidth=0.7, markersize=2, label=algo)
+    # Plot Communications, Iterations and Time per Robot vs Robots, computing
+    # the three normalized series of each algorithm together
+    for algo, algo_data in groups.items():
+        robot_count = algo_data['robot_count'].to_numpy()
+        for ax, per_robot in zip((ax1, ax2, ax3), _normalized_series(algo_data)):
+            line = ax.plot(robot_count, per_robot, 
+                           color=colors[algo], marker=markers[algo], 
+                           linewidth=0.7, markersize=2)
+            lines[algo].append(line[0])
+        lines[algo][0].set_label(algo)
         
         # Only add to legend once per algorithm
         if algo not in [label for label in legend_labels]:
-            legend_lines.append(line[0])
+            legend_lines.append(lines[algo][0])
             display_name = legend_override.get(algo, algo) if legend_override else algo
             legend_labels.append(display_name)
     
     ax1.set_ylabel('Comm. per Robot')
     ax1.grid(True, alpha=0.3)
-    
-    # Plot Iterations per Robot vs Robots
-    for algo in df['algorithm'].unique():
-        if pd.isna(algo):
-            continue
-        algo_data = df[df['algorithm'] == algo]
-        iter_per_robot = algo_data['position_convergence_iteration'] / algo_data['robot_count']
-        ax2.plot(algo_data['robot_count'], iter_per_robot, 
-                color=colors[algo], marker=markers[algo], 
-                linewidth=0.7, markersize=2)
-
     ax2.set_ylabel('Iter. per Robot')
     ax2.grid(True, alpha=0.3)
-    
-    # Plot Time per Robot vs Robots
-    for algo in df['algorithm'].unique():
-        if pd.isna(algo):
-            continue
-        algo_data = df[df['algorithm'] == algo]
-        time_per_robot = algo_data['position_convergence_time'] / algo_data['robot_count']
-        ax3.plot(algo_data['robot_count'], time_per_robot, 
-                color=colors[algo], marker=markers[algo], 
-                linewidth=0.7, markersize=2)
-
     ax3.set_xlabel('Number of Robots')
     ax3.set_ylabel('Time per Robot (s)')
     ax3.grid(True, alpha=0.3)
     
-    # Set x-axis ticks to include start and end points
-    ax3.set_xticks(range(5, 16))  # 5 to 15 inclusive
+    _align_x([ax1, ax2, ax3])
     
     # Add shared legend at the bottom
     fig.legend(legend_lines, legend_labels, loc='lower center', 
                bbox_to_anchor=(0.5, -0.08), ncol=len(legend_labels), 
                fontsize=7, frameon=False)
     
-    plt.tight_layout()
-    plt.subplots_adjust(bottom=0.08)  # Make room for legend
-    plt.savefig('scalability.pdf', dpi=300, bbox_inches='tight')
-    plt.show()
+    fig.get_layout_engine().set(rect=(0, 0.08, 1, 0.92))  # Make room for legend
+    return fig, lines
+
+def create_original_plots(df, colors, markers, legend_override=None):
+    """Create plots showing absolute metrics vs robot count"""
+    # Split by algorithm once and reuse the groups for every subplot
+    groups = dict(list(df.groupby('algorithm', sort=False, observed=True)))
+    
+    # Reuse the figure from a previous call when only the data changed
+    cached = _cached_figure('orig', groups)
+    if cached is not None:
+        fig, lines = cached
+        _update_lines(fig, lines, groups, _original_series)
+    else:
+        fig, lines = _FIG_CACHE['orig'] = _build_original(groups, colors, markers, legend_override)
+    
+    fig.savefig('position_convergence_ieee.png', dpi=300, bbox_inches='tight')
+    if not HEADLESS and sys.stdout.isatty():
+        plt.show()
+    print("Original plots saved as 'position_convergence_ieee.png'")
+
+def create_normalized_plots(df, colors, markers, legend_override=None):
+    """Create plots showing normalized metrics vs robot count"""
+    # Split by algorithm once and reuse the groups for every subplot
+    groups = dict(list(df.groupby('algorithm', sort=False, observed=True)))
+    
+    # Reuse the figure from a previous call when only the data changed
+    cached = _cached_figure('norm', groups)
+    if cached is not None:
+        fig, lines = cached
+        _update_lines(fig, lines, groups, _normalized_series)
+    else:
+        fig, lines = _FIG_CACHE['norm'] = _build_normalized(groups, colors, markers, legend_override)
+    
+    fig.savefig('scalability.pdf', dpi=300, bbox_inches='tight')
+    if not HEADLESS and sys.stdout.isatty():
+        plt.show()
     print("Normalized plots saved as 'scalability.pdf'")
 
 if __name__ == "__main__":
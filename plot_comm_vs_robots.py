@@ -9,24 +9,14 @@ import matplotlib.pyplot as plt
 import numpy as np
 import seaborn as sns
 
-def extract_robot_count(grid_size_str):
-    """
-    Extract robot count from grid size string like '15_15' -> 15
-    Assumes square grids where both dimensions are the same
-    """
-    if pd.isna(grid_size_str):
-        return None
-    parts = grid_size_str.split('_')
-    if len(parts) >= 2:
-        return int(parts[0])  # Take the first dimension
-    return None
-
 def main():
     # Read the convergence analysis results
-    df = pd.read_csv('convergence_analysis_results.csv')
+    df = pd.read_csv('convergence_analysis_results.csv', dtype={'algorithm': 'category'})
     
-    # Extract robot count from grid size
-    df['robot_count'] = df['grid_size'].apply(extract_robot_count)
+    # Extract robot count from grid size strings like '15_15' -> 15
+    # (square grids, so the first dimension is the robot count)
+    grid_parts = df['grid_size'].astype(str).str.split('_')
+    df['robot_count'] = pd.to_numeric(grid_parts.str[0].where(grid_parts.str.len() >= 2), errors='coerce')
     
     # Remove rows where robot count couldn't be extracted
     df = df.dropna(subset=['robot_count'])
@@ -46,12 +36,17 @@ def main():
     # Define colors for algorithms
     colors = {'asapp': 'red', 'dgs': 'blue', 'geodesic-mesa': 'green'}
     
+    # Each subplot is one seaborn call that splits the frame by algorithm itself;
+    # raw points are plotted (no aggregation) with matplotlib-style markers
+    # (hue_order keeps the legend in order of appearance rather than category order)
+    palette = {algorithm: colors.get(algorithm, 'black') for algorithm in df['algorithm'].unique()}
+    line_kws = dict(x='robot_count', hue='algorithm', hue_order=list(palette), palette=palette,
+                    estimator=None, sort=False, marker='o', linewidth=2, markersize=6,
+                    markeredgecolor=None, markeredgewidth=1)
+    
     # Plot 1: Total Communications vs Robot Count
     ax1 = axes[0, 0]
-    for algorithm in df['algorithm'].unique():
-        alg_data = df[df['algorithm'] == algorithm]
-        ax1.plot(alg_data['robot_count'], alg_data['total_communications'], 
-                'o-', label=algorithm, color=colors.get(algorithm, 'black'), linewidth=2, markersize=6)
+    sns.lineplot(data=df, y='total_communications', ax=ax1, **line_kws)
     
     ax1.set_xlabel('Number of Robots')
     ax1.set_ylabel('Total Communications')
@@ -62,13 +57,9 @@ def main():
     
     # Plot 2: Position Convergence Communications vs Robot Count
     ax2 = axes[0, 1]
-    for algorithm in df['algorithm'].unique():
-        alg_data = df[df['algorithm'] == algorithm]
-        # Filter out NaN values for convergence communications
-        valid_data = alg_data.dropna(subset=['position_convergence_comm'])
-        if len(valid_data) > 0:
-            ax2.plot(valid_data['robot_count'], valid_data['position_convergence_comm'], 
-                    'o-', label=algorithm, color=colors.get(algorithm, 'black'), linewidth=2, markersize=6)
+    # Filter out NaN values for convergence communications
+    valid_data = df.dropna(subset=['position_convergence_comm'])
+    sns.lineplot(data=valid_data, y='position_convergence_comm', ax=ax2, **line_kws)
     
     ax2.set_xlabel('Number of Robots')
     ax2.set_ylabel('Communications to 1% Position Convergence')
@@ -79,12 +70,8 @@ def main():
     
     # Plot 3: Position Convergence Ratio vs Robot Count
     ax3 = axes[1, 0]
-    for algorithm in df['algorithm'].unique():
-        alg_data = df[df['algorithm'] == algorithm]
-        valid_data = alg_data.dropna(subset=['position_convergence_ratio'])
-        if len(valid_data) > 0:
-            ax3.plot(valid_data['robot_count'], valid_data['position_convergence_ratio'] * 100, 
-                    'o-', label=algorithm, color=colors.get(algorithm, 'black'), linewidth=2, markersize=6)
+    valid_data = df.dropna(subset=['position_convergence_ratio'])
+    sns.lineplot(data=valid_data, y=valid_data['position_convergence_ratio'] * 100, ax=ax3, **line_kws)
     
     ax3.set_xlabel('Number of Robots')
     ax3.set_ylabel('Position Convergence Ratio (%)')
@@ -95,13 +82,9 @@ def main():
     
     # Plot 4: Final Position Error vs Robot Count
     ax4 = axes[1, 1]
-    for algorithm in df['algorithm'].unique():
-        alg_data = df[df['algorithm'] == algorithm]
-        # Filter out extremely large values (likely diverged cases)
-        valid_data = alg_data[alg_data['final_position_error'] < 1000]
-        if len(valid_data) > 0:
-            ax4.plot(valid_data['robot_count'], valid_data['final_position_error'], 
-                    'o-', label=algorithm, color=colors.get(algorithm, 'black'), linewidth=2, markersize=6)
+    # Filter out extremely large values (likely diverged cases)
+    valid_data = df.query('final_position_error < 1000')
+    sns.lineplot(data=valid_data, y='final_position_error', ax=ax4, **line_kws)
     
     ax4.set_xlabel('Number of Robots')
     ax4.set_ylabel('Final Position Error')
@@ -118,8 +101,8 @@ def main():
     # Create a separate detailed plot for communication scaling
     fig2, ax = plt.subplots(1, 1, figsize=(12, 8))
     
-    for algorithm in df['algorithm'].unique():
-        alg_data = df[df['algorithm'] == algorithm]
+    # One pass over the algorithm groups, in order of appearance
+    for algorithm, alg_data in df.groupby('algorithm', sort=False, observed=True):
         ax.plot(alg_data['robot_count'], alg_data['total_communications'], 
                 'o-', label=f'{algorithm} (total)', color=colors.get(algorithm, 'black'), 
                 linewidth=3, markersize=8, alpha=0.8)
@@ -141,26 +124,26 @@ def main():
     # Add scaling reference lines
     robot_range = np.array([5, 15])
     
-    # Linear scaling reference
-    linear_ref = robot_range * 1000  # Arbitrary scaling
-    ax.plot(robot_range, linear_ref, 'k:', alpha=0.5, label='Linear reference')
-    
-    # Quadratic scaling reference
+    # Linear and quadratic scaling references (arbitrary scaling), drawn as the
+    # two columns of one plot call
+    linear_ref = robot_range * 1000
     quad_ref = (robot_range ** 2) * 100
-    ax.plot(robot_range, quad_ref, 'k-.', alpha=0.5, label='Quadratic reference')
+    linear_line, quad_line = ax.plot(robot_range, np.column_stack([linear_ref, quad_ref]), 'k', alpha=0.5,
+                                     label=['Linear reference', 'Quadratic reference'])
+    linear_line.set_linestyle(':')
+    quad_line.set_linestyle('-.')
     
     ax.legend(fontsize=11)
     
     plt.tight_layout()
     plt.savefig('communication_scaling_detailed.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    plt.close(fig2)
     
     # Print summary statistics
     print("\nSummary Statistics by Algorithm:")
     print("=" * 50)
     
-    for algorithm in sorted(df['algorithm'].unique()):
-        alg_data = df[df['algorithm'] == algorithm]
+    for algorithm, alg_data in df.groupby('algorithm', sort=True, observed=True):
         print(f"\n{algorithm.upper()}:")
         print(f"  Robot counts tested: {sorted(alg_data['robot_count'].unique())}")
         print(f"  Communication range: {alg_data['total_communications'].min():.0f} - {alg_data['total_communications'].max():.0f}")
@@ -175,7 +158,7 @@ def main():
             print(f"  Final error range: {valid_errors['final_position_error'].min():.6f} - {valid_errors['final_position_error'].max():.6f}")
     
     # Create a data table for easy reference
-    summary_table = df.groupby(['algorithm', 'robot_count']).agg({
+    summary_table = df.groupby(['algorithm', 'robot_count'], observed=True).agg({
         'total_communications': 'first',
         'position_convergence_comm': 'first',
         'position_convergence_ratio': 'first',
@@ -8,41 +8,78 @@ Simplified script to plot only position convergence metrics:
 
 import pandas as pd
 import matplotlib.pyplot as plt
+from matplotlib import ticker
 import numpy as np
+import seaborn as sns
 
-def plot_position_convergence_metrics():
-    """Plot the three key position convergence metrics."""
+# Plotting style for IEEE paper format
+IEEE_STYLE = {
+    'font.family': 'serif',
+    'font.serif': ['Times New Roman'],
+    'font.size': 8,
+    'axes.titlesize': 8,
+    'axes.labelsize': 8,
+    'xtick.labelsize': 8,
+    'ytick.labelsize': 8,
+    'legend.fontsize': 7,
+    'figure.titlesize': 9,
+    'lines.linewidth': 1.5,
+    'lines.markersize': 4,
+    'grid.linewidth': 0.5,
+    'axes.linewidth': 0.8
+}
+
+def load_enhanced_analysis():
+    """
+    Load the enhanced analysis results, keeping only rows with a robot count.
     
-    # Read the enhanced convergence analysis results
+    Returns:
+        DataFrame sorted by robot count, or None if the CSV does not exist
+    """
     try:
-        df = pd.read_csv('enhanced_convergence_analysis.csv')
+        df = pd.read_csv('enhanced_convergence_analysis.csv', dtype={'algorithm': 'category'})
     except FileNotFoundError:
-        print("enhanced_convergence_analysis.csv not found! Run analyze_convergence_with_timing.py first.")
-        return
+        return None
     
     # Filter out rows without robot_count
-    df = df.dropna(subset=['robot_count']).sort_values('robot_count')
+    return df.dropna(subset=['robot_count']).sort_values('robot_count')
+
+def plot_metric(ax, df, column, ylabel, title, robot_counts, colors, markers):
+    """Plot one metric against robot count on ax, one line per algorithm."""
+    # Drop missing values with one mask over the column; seaborn then draws
+    # every algorithm in one call, resolving the style dicts once. The hue is
+    # passed as strings, since with a categorical column and estimator=None
+    # seaborn can pair the groups with the wrong colors and markers
+    valid = df[df[column].notna()]
+    valid = valid.assign(algorithm=valid['algorithm'].astype(str))
+    algorithms = sorted(valid['algorithm'].unique())
+    sns.lineplot(data=valid, x='robot_count', y=column, hue='algorithm', style='algorithm',
+                 hue_order=algorithms, style_order=algorithms, ax=ax,
+                 palette={algorithm: colors.get(algorithm, 'black') for algorithm in algorithms},
+                 markers={algorithm: markers.get(algorithm, 'o') for algorithm in algorithms},
+                 dashes=False, estimator=None, sort=False, linewidth=1.5, markersize=4, markerfacecolor='white',
+                 markeredgewidth=1, markeredgecolor=None)
+    
+    ax.set_xlabel('Number of Robots', fontsize=8)
+    ax.set_ylabel(ylabel, fontsize=8)
+    ax.set_title(title, fontsize=8, fontweight='bold')
+    ax.legend(fontsize=7, loc='upper left')
+    ax.grid(True, alpha=0.3, linewidth=0.5)
+    
+    # Tick at every robot count, labelled as integers when drawn
+    ax.xaxis.set_major_locator(ticker.FixedLocator(robot_counts))
+    ax.xaxis.set_major_formatter(ticker.FormatStrFormatter('%d'))
+
+def plot_position_convergence_metrics(df):
+    """Plot the three key position convergence metrics."""
+    
+    # Split by algorithm once; the comparison printout reuses the groups
+    grouped = df.groupby('algorithm', sort=True, observed=True)
     
     print(f"Plotting data for {len(df)} experiments")
-    print(f"Algorithms: {sorted(df['algorithm'].unique())}")
-    print(f"Robot counts: {sorted(df['robot_count'].unique())}")
-    
-    # Set up the plotting style for IEEE paper format
-    plt.rcParams.update({
-        'font.family': 'serif',
-        'font.serif': ['Times New Roman'],
-        'font.size': 8,
-        'axes.titlesize': 8,
-        'axes.labelsize': 8,
-        'xtick.labelsize': 8,
-        'ytick.labelsize': 8,
-        'legend.fontsize': 7,
-        'figure.titlesize': 9,
-        'lines.linewidth': 1.5,
-        'lines.markersize': 4,
-        'grid.linewidth': 0.5,
-        'axes.linewidth': 0.8
-    })
+    print(f"Algorithms: {list(grouped.groups)}")
+    robot_counts = sorted(df['robot_count'].unique())
+    print(f"Robot counts: {robot_counts}")
     
     colors = {'asapp': 'red', 'dgs': 'blue', 'geodesic-mesa': 'green', 'CBS': 'purple'}
     markers = {'asapp': 'o', 'dgs': 's', 'geodesic-mesa': '^', 'CBS': 'D'}
@@ -52,73 +89,16 @@ def plot_position_convergence_metrics():
     fig, axes = plt.subplots(1, 3, figsize=(10.5, 2.8))  # 3.5 inches per subplot
     fig.suptitle('Position Convergence Analysis vs. Number of Robots', fontsize=9, fontweight='bold')
     
-    # Plot 1: Position Convergence Communications vs Robot Count
-    ax1 = axes[0]
-    for algorithm in sorted(df['algorithm'].unique()):
-        alg_data = df[df['algorithm'] == algorithm]
-        valid_data = alg_data.dropna(subset=['position_convergence_comm'])
-        if len(valid_data) > 0:
-            ax1.plot(valid_data['robot_count'], valid_data['position_convergence_comm'], 
-                    marker=markers.get(algorithm, 'o'), linestyle='-', 
-                    label=algorithm, color=colors.get(algorithm, 'black'), 
-                    linewidth=1.5, markersize=4, markerfacecolor='white', 
-                    markeredgewidth=1, markeredgecolor=colors.get(algorithm, 'black'))
-    
-    ax1.set_xlabel('Number of Robots', fontsize=8)
-    ax1.set_ylabel('Communications to 1%\nPosition Convergence', fontsize=8)
-    ax1.set_title('Position Convergence\nCommunications', fontsize=8, fontweight='bold')
-    ax1.legend(fontsize=7, loc='upper left')
-    ax1.grid(True, alpha=0.3, linewidth=0.5)
-    # ax1.set_yscale('log')
-    
-    # Add robot count labels on x-axis
-    robot_counts = sorted(df['robot_count'].unique())
-    ax1.set_xticks(robot_counts)
-    ax1.set_xticklabels([f'{int(x)}' for x in robot_counts])
-    
-    # Plot 2: Position Convergence Iterations vs Robot Count
-    ax2 = axes[1]
-    for algorithm in sorted(df['algorithm'].unique()):
-        alg_data = df[df['algorithm'] == algorithm]
-        valid_data = alg_data.dropna(subset=['position_convergence_iteration'])
-        if len(valid_data) > 0:
-            ax2.plot(valid_data['robot_count'], valid_data['position_convergence_iteration'], 
-                    marker=markers.get(algorithm, 'o'), linestyle='-',
-                    label=algorithm, color=colors.get(algorithm, 'black'), 
-                    linewidth=1.5, markersize=4, markerfacecolor='white', 
-                    markeredgewidth=1, markeredgecolor=colors.get(algorithm, 'black'))
-    
-    ax2.set_xlabel('Number of Robots', fontsize=8)
-    ax2.set_ylabel('Iterations to 1%\nPosition Convergence', fontsize=8)
-    ax2.set_title('Position Convergence\nIterations', fontsize=8, fontweight='bold')
-    ax2.legend(fontsize=7, loc='upper left')
-    ax2.grid(True, alpha=0.3, linewidth=0.5)
-    # ax2.set_yscale('log')
-    
-    ax2.set_xticks(robot_counts)
-    ax2.set_xticklabels([f'{int(x)}' for x in robot_counts])
-    
-    # Plot 3: Position Convergence Time vs Robot Count
-    ax3 = axes[2]
-    for algorithm in sorted(df['algorithm'].unique()):
-        alg_data = df[df['algorithm'] == algorithm]
-        valid_data = alg_data.dropna(subset=['position_convergence_time'])
-        if len(valid_data) > 0:
-            ax3.plot(valid_data['robot_count'], valid_data['position_convergence_time'], 
-                    marker=markers.get(algorithm, 'o'), linestyle='-',
-                    label=algorithm, color=colors.get(algorithm, 'black'), 
-                    linewidth=1.5, markersize=4, markerfacecolor='white', 
-                    markeredgewidth=1, markeredgecolor=colors.get(algorithm, 'black'))
-    
-    ax3.set_xlabel('Number of Robots', fontsize=8)
-    ax3.set_ylabel('Time to 1% Position\nConvergence (s)', fontsize=8)
-    ax3.set_title('Position Convergence\nTime', fontsize=8, fontweight='bold')
-    ax3.legend(fontsize=7, loc='upper left')
-    ax3.grid(True, alpha=0.3, linewidth=0.5)
-    # ax3.set_yscale('log')
-    
-    ax3.set_xticks(robot_counts)
-    ax3.set_xticklabels([f'{int(x)}' for x in robot_counts])
+    # Column, y label and title of each subplot
+    specs = [
+        ('position_convergence_comm', 'Communications to 1%\nPosition Convergence', 'Position Convergence\nCommunications'),
+        ('position_convergence_iteration', 'Iterations to 1%\nPosition Convergence', 'Position Convergence\nIterations'),
+        ('position_convergence_time', 'Time to 1% Position\nConvergence (s)', 'Position Convergence\nTime'),
+    ]
+    
+    # Robot counts label the x-axis of every subplot
+    for ax, (column, ylabel, title) in zip(axes, specs):
+        plot_metric(ax, df, column, ylabel, title, robot_counts, colors, markers)
     
     plt.tight_layout()
     plt.subplots_adjust(top=0.85)  # Make room for suptitle
@@ -126,24 +106,21 @@ def plot_position_convergence_metrics():
     print("Saved: position_convergence_analysis.png")
     plt.close()
     
-    # Create a summary table for the three metrics
-    summary_data = []
-    for algorithm in sorted(df['algorithm'].unique()):
-        alg_data = df[df['algorithm'] == algorithm]
-        for robot_count in sorted(alg_data['robot_count'].unique()):
-            robot_data = alg_data[alg_data['robot_count'] == robot_count]
-            if len(robot_data) > 0:
-                row_data = robot_data.iloc[0]
-                summary_data.append({
-                    'Algorithm': algorithm,
-                    'Robot_Count': int(robot_count),
-                    'Convergence_Communications': row_data.get('position_convergence_comm', 'N/A'),
-                    'Convergence_Iterations': row_data.get('position_convergence_iteration', 'N/A'),
-                    'Convergence_Time_s': row_data.get('position_convergence_time', 'N/A'),
-                    'Final_Position_Error': row_data.get('final_position_error', 'N/A')
-                })
-    
-    summary_df = pd.DataFrame(summary_data)
+    # Create a summary table for the three metrics: first entry per (algorithm, robot count)
+    summary_df = (df.groupby(['algorithm', 'robot_count'], sort=True, observed=True)
+                  [['position_convergence_comm', 'position_convergence_iteration',
+                    'position_convergence_time', 'final_position_error']]
+                  .first(skipna=False)
+                  .reset_index()
+                  .rename(columns={
+                      'algorithm': 'Algorithm',
+                      'robot_count': 'Robot_Count',
+                      'position_convergence_comm': 'Convergence_Communications',
+                      'position_convergence_iteration': 'Convergence_Iterations',
+                      'position_convergence_time': 'Convergence_Time_s',
+                      'final_position_error': 'Final_Position_Error'
+                  }))
+    summary_df['Robot_Count'] = summary_df['Robot_Count'].astype(int)
     
     # Print summary table
     print("\nPosition Convergence Summary Table:")
@@ -158,63 +135,46 @@ def plot_position_convergence_metrics():
     print("\nAlgorithm Performance Comparison:")
     print("=" * 60)
     
-    for algorithm in sorted(df['algorithm'].unique()):
-        alg_data = df[df['algorithm'] == algorithm]
-        
-        # Filter valid convergence data
-        valid_comm = alg_data.dropna(subset=['position_convergence_comm'])
-        valid_iter = alg_data.dropna(subset=['position_convergence_iteration'])
-        valid_time = alg_data.dropna(subset=['position_convergence_time'])
+    # Min, max, mean and number of valid values of every metric per algorithm in one pass
+    stats = grouped[['position_convergence_comm', 'position_convergence_iteration',
+                     'position_convergence_time']].agg(['min', 'max', 'mean', 'count'])
+    
+    for algorithm, alg_stats in stats.iterrows():
+        comm = alg_stats['position_convergence_comm']
+        iters = alg_stats['position_convergence_iteration']
+        times = alg_stats['position_convergence_time']
         
         print(f"\n{algorithm.upper()}:")
-        if len(valid_comm) > 0:
-            print(f"  Communications: {valid_comm['position_convergence_comm'].min():.0f} - {valid_comm['position_convergence_comm'].max():.0f}")
-        if len(valid_iter) > 0:
-            print(f"  Iterations: {valid_iter['position_convergence_iteration'].min():.0f} - {valid_iter['position_convergence_iteration'].max():.0f}")
-        if len(valid_time) > 0:
-            print(f"  Time: {valid_time['position_convergence_time'].min():.1f}s - {valid_time['position_convergence_time'].max():.1f}s")
+        if comm['count'] > 0:
+            print(f"  Communications: {comm['min']:.0f} - {comm['max']:.0f}")
+        if iters['count'] > 0:
+            print(f"  Iterations: {iters['min']:.0f} - {iters['max']:.0f}")
+        if times['count'] > 0:
+            print(f"  Time: {times['min']:.1f}s - {times['max']:.1f}s")
         
-        # Calculate averages
-        if len(valid_comm) > 0:
-            print(f"  Average communications: {valid_comm['position_convergence_comm'].mean():.0f}")
-        if len(valid_iter) > 0:
-            print(f"  Average iterations: {valid_iter['position_convergence_iteration'].mean():.0f}")
-        if len(valid_time) > 0:
-            print(f"  Average time: {valid_time['position_convergence_time'].mean():.1f}s")
+        # Averages
+        if comm['count'] > 0:
+            print(f"  Average communications: {comm['mean']:.0f}")
+        if iters['count'] > 0:
+            print(f"  Average iterations: {iters['mean']:.0f}")
+        if times['count'] > 0:
+            print(f"  Average time: {times['mean']:.1f}s")
 
-def plot_normalized_convergence_metrics():
+def plot_normalized_convergence_metrics(df):
     """Plot the three key position convergence metrics normalized by number of robots."""
     
-    # Read the enhanced convergence analysis results
-    try:
-        df = pd.read_csv('enhanced_convergence_analysis.csv')
-    except FileNotFoundError:
-        print("enhanced_convergence_analysis.csv not found! Run analyze_convergence_with_timing.py first.")
-        return
+    # Per robot metrics, divided once for the whole frame
+    df = df.assign(comm_per_robot=df['position_convergence_comm'] / df['robot_count'],
+                   iter_per_robot=df['position_convergence_iteration'] / df['robot_count'],
+                   time_per_robot=df['position_convergence_time'] / df['robot_count'])
     
-    # Filter out rows without robot_count
-    df = df.dropna(subset=['robot_count']).sort_values('robot_count')
+    # Split by algorithm once; the comparison printout reuses the groups
+    grouped = df.groupby('algorithm', sort=True, observed=True)
     
     print(f"\nPlotting normalized data for {len(df)} experiments")
-    print(f"Algorithms: {sorted(df['algorithm'].unique())}")
-    print(f"Robot counts: {sorted(df['robot_count'].unique())}")
-    
-    # Set up the plotting style for IEEE paper format
-    plt.rcParams.update({
-        'font.family': 'serif',
-        'font.serif': ['Times New Roman'],
-        'font.size': 8,
-        'axes.titlesize': 8,
-        'axes.labelsize': 8,
-        'xtick.labelsize': 8,
-        'ytick.labelsize': 8,
-        'legend.fontsize': 7,
-        'figure.titlesize': 9,
-        'lines.linewidth': 1.5,
-        'lines.markersize': 4,
-        'grid.linewidth': 0.5,
-        'axes.linewidth': 0.8
-    })
+    print(f"Algorithms: {list(grouped.groups)}")
+    robot_counts = sorted(df['robot_count'].unique())
+    print(f"Robot counts: {robot_counts}")
     
     colors = {'asapp': 'red', 'dgs': 'blue', 'geodesic-mesa': 'green', 'CBS': 'purple'}
     markers = {'asapp': 'o', 'dgs': 's', 'geodesic-mesa': '^', 'CBS': 'D'}
@@ -223,73 +183,16 @@ def plot_normalized_convergence_metrics():
     fig, axes = plt.subplots(1, 3, figsize=(10.5, 2.8))
     fig.suptitle('Position Convergence Analysis Normalized by Number of Robots', fontsize=9, fontweight='bold')
     
-    # Plot 1: Position Convergence Communications per Robot vs Robot Count
-    ax1 = axes[0]
-    for algorithm in sorted(df['algorithm'].unique()):
-        alg_data = df[df['algorithm'] == algorithm]
-        valid_data = alg_data.dropna(subset=['position_convergence_comm'])
-        if len(valid_data) > 0:
-            normalized_comm = valid_data['position_convergence_comm'] / valid_data['robot_count']
-            ax1.plot(valid_data['robot_count'], normalized_comm, 
-                    marker=markers.get(algorithm, 'o'), linestyle='-', 
-                    label=algorithm, color=colors.get(algorithm, 'black'), 
-                    linewidth=1.5, markersize=4, markerfacecolor='white', 
-                    markeredgewidth=1, markeredgecolor=colors.get(algorithm, 'black'))
-    
-    ax1.set_xlabel('Number of Robots', fontsize=8)
-    ax1.set_ylabel('Communications\nper Robot', fontsize=8)
-    ax1.set_title('Position Convergence\nCommunications per Robot', fontsize=8, fontweight='bold')
-    ax1.legend(fontsize=7, loc='upper left')
-    ax1.grid(True, alpha=0.3, linewidth=0.5)
-    
-    # Add robot count labels on x-axis
-    robot_counts = sorted(df['robot_count'].unique())
-    ax1.set_xticks(robot_counts)
-    ax1.set_xticklabels([f'{int(x)}' for x in robot_counts])
-    
-    # Plot 2: Position Convergence Iterations per Robot vs Robot Count
-    ax2 = axes[1]
-    for algorithm in sorted(df['algorithm'].unique()):
-        alg_data = df[df['algorithm'] == algorithm]
-        valid_data = alg_data.dropna(subset=['position_convergence_iteration'])
-        if len(valid_data) > 0:
-            normalized_iter = valid_data['position_convergence_iteration'] / valid_data['robot_count']
-            ax2.plot(valid_data['robot_count'], normalized_iter, 
-                    marker=markers.get(algorithm, 'o'), linestyle='-',
-                    label=algorithm, color=colors.get(algorithm, 'black'), 
-                    linewidth=1.5, markersize=4, markerfacecolor='white', 
-                    markeredgewidth=1, markeredgecolor=colors.get(algorithm, 'black'))
-    
-    ax2.set_xlabel('Number of Robots', fontsize=8)
-    ax2.set_ylabel('Iterations\nper Robot', fontsize=8)
-    ax2.set_title('Position Convergence\nIterations per Robot', fontsize=8, fontweight='bold')
-    ax2.legend(fontsize=7, loc='upper left')
-    ax2.grid(True, alpha=0.3, linewidth=0.5)
-    
-    ax2.set_xticks(robot_counts)
-    ax2.set_xticklabels([f'{int(x)}' for x in robot_counts])
-    
-    # Plot 3: Position Convergence Time per Robot vs Robot Count
-    ax3 = axes[2]
-    for algorithm in sorted(df['algorithm'].unique()):
-        alg_data = df[df['algorithm'] == algorithm]
-        valid_data = alg_data.dropna(subset=['position_convergence_time'])
-        if len(valid_data) > 0:
-            normalized_time = valid_data['position_convergence_time'] / valid_data['robot_count']
-            ax3.plot(valid_data['robot_count'], normalized_time, 
-                    marker=markers.get(algorithm, 'o'), linestyle='-',
-                    label=algorithm, color=colors.get(algorithm, 'black'), 
-                    linewidth=1.5, markersize=4, markerfacecolor='white', 
-                    markeredgewidth=1, markeredgecolor=colors.get(algorithm, 'black'))
-    
-    ax3.set_xlabel('Number of Robots', fontsize=8)
-    ax3.set_ylabel('Time per Robot (s)', fontsize=8)
-    ax3.set_title('Position Convergence\nTime per Robot', fontsize=8, fontweight='bold')
-    ax3.legend(fontsize=7, loc='upper left')
-    ax3.grid(True, alpha=0.3, linewidth=0.5)
-    
-    ax3.set_xticks(robot_counts)
-    ax3.set_xticklabels([f'{int(x)}' for x in robot_counts])
+    # Column, y label and title of each subplot
+    specs = [
+        ('comm_per_robot', 'Communications\nper Robot', 'Position Convergence\nCommunications per Robot'),
+        ('iter_per_robot', 'Iterations\nper Robot', 'Position Convergence\nIterations per Robot'),
+        ('time_per_robot', 'Time per Robot (s)', 'Position Convergence\nTime per Robot'),
+    ]
+    
+    # Robot counts label the x-axis of every subplot
+    for ax, (column, ylabel, title) in zip(axes, specs):
+        plot_metric(ax, df, column, ylabel, title, robot_counts, colors, markers)
     
     plt.tight_layout()
     plt.subplots_adjust(top=0.85)  # Make room for suptitle
@@ -297,59 +200,60 @@ def plot_normalized_convergence_metrics():
     print("Saved: position_convergence_normalized.png")
     plt.close()
     
-    # Create a normalized summary table
-    normalized_summary_data = []
-    for algorithm in sorted(df['algorithm'].unique()):
-        alg_data = df[df['algorithm'] == algorithm]
-        for robot_count in sorted(alg_data['robot_count'].unique()):
-            robot_data = alg_data[alg_data['robot_count'] == robot_count]
-            if len(robot_data) > 0:
-                row_data = robot_data.iloc[0]
-                normalized_summary_data.append({
-                    'Algorithm': algorithm,
-                    'Robot_Count': int(robot_count),
-                    'Comm_per_Robot': row_data.get('position_convergence_comm', 0) / robot_count if pd.notna(row_data.get('position_convergence_comm')) else 'N/A',
-                    'Iter_per_Robot': row_data.get('position_convergence_iteration', 0) / robot_count if pd.notna(row_data.get('position_convergence_iteration')) else 'N/A',
-                    'Time_per_Robot_s': row_data.get('position_convergence_time', 0) / robot_count if pd.notna(row_data.get('position_convergence_time')) else 'N/A',
-                })
-    
-    normalized_summary_df = pd.DataFrame(normalized_summary_data)
+    # Create a normalized summary table: first entry per (algorithm, robot count)
+    normalized_summary_df = (df.groupby(['algorithm', 'robot_count'], sort=True, observed=True)
+                             [['comm_per_robot', 'iter_per_robot', 'time_per_robot']]
+                             .first(skipna=False)
+                             .reset_index()
+                             .rename(columns={
+                                 'algorithm': 'Algorithm',
+                                 'robot_count': 'Robot_Count',
+                                 'comm_per_robot': 'Comm_per_Robot',
+                                 'iter_per_robot': 'Iter_per_Robot',
+                                 'time_per_robot': 'Time_per_Robot_s'
+                             }))
+    normalized_summary_df['Robot_Count'] = normalized_summary_df['Robot_Count'].astype(int)
     
     # Print normalized summary table
     print("\nNormalized Position Convergence Summary Table:")
     print("=" * 80)
-    print(normalized_summary_df.to_string(index=False, float_format='%.2f'))
+    print(normalized_summary_df.to_string(index=False, float_format='%.2f', na_rep='N/A'))
     
     # Save normalized summary table
-    normalized_summary_df.to_csv('position_convergence_normalized_summary.csv', index=False)
+    normalized_summary_df.to_csv('position_convergence_normalized_summary.csv', index=False, na_rep='N/A')
     print(f"\nNormalized summary table saved to: position_convergence_normalized_summary.csv")
     
     # Print normalized algorithm comparison
     print("\nNormalized Algorithm Performance Comparison:")
     print("=" * 60)
     
-    for algorithm in sorted(df['algorithm'].unique()):
-        alg_data = df[df['algorithm'] == algorithm]
-        
-        # Calculate normalized metrics
-        valid_comm = alg_data.dropna(subset=['position_convergence_comm'])
-        valid_iter = alg_data.dropna(subset=['position_convergence_iteration'])
-        valid_time = alg_data.dropna(subset=['position_convergence_time'])
+    # Min, max, mean and number of valid values of every per robot metric in one pass
+    stats = grouped[['comm_per_robot', 'iter_per_robot', 'time_per_robot']].agg(['min', 'max', 'mean', 'count'])
+    
+    for algorithm, alg_stats in stats.iterrows():
+        comm = alg_stats['comm_per_robot']
+        iters = alg_stats['iter_per_robot']
+        times = alg_stats['time_per_robot']
         
         print(f"\n{algorithm.upper()} (per robot):")
-        if len(valid_comm) > 0:
-            comm_per_robot = valid_comm['position_convergence_comm'] / valid_comm['robot_count']
-            print(f"  Communications: {comm_per_robot.min():.0f} - {comm_per_robot.max():.0f} (avg: {comm_per_robot.mean():.0f})")
-        if len(valid_iter) > 0:
-            iter_per_robot = valid_iter['position_convergence_iteration'] / valid_iter['robot_count']
-            print(f"  Iterations: {iter_per_robot.min():.0f} - {iter_per_robot.max():.0f} (avg: {iter_per_robot.mean():.0f})")
-        if len(valid_time) > 0:
-            time_per_robot = valid_time['position_convergence_time'] / valid_time['robot_count']
-            print(f"  Time: {time_per_robot.min():.1f}s - {time_per_robot.max():.1f}s (avg: {time_per_robot.mean():.1f}s)")
+        if comm['count'] > 0:
+            print(f"  Communications: {comm['min']:.0f} - {comm['max']:.0f} (avg: {comm['mean']:.0f})")
+        if iters['count'] > 0:
+            print(f"  Iterations: {iters['min']:.0f} - {iters['max']:.0f} (avg: {iters['mean']:.0f})")
+        if times['count'] > 0:
+            print(f"  Time: {times['min']:.1f}s - {times['max']:.1f}s (avg: {times['mean']:.1f}s)")
 
 def main():
-    plot_position_convergence_metrics()
-    plot_normalized_convergence_metrics()
+    # Read the enhanced convergence analysis results once for both figures
+    df = load_enhanced_analysis()
+    if df is None:
+        print("enhanced_convergence_analysis.csv not found! Run analyze_convergence_with_timing.py first.")
+        return
+    
+    # Apply the style once for both figures and restore the previous rcParams afterwards
+    with plt.rc_context(IEEE_STYLE):
+        plot_position_convergence_metrics(df)
+        plot_normalized_convergence_metrics(df)
 
 if __name__ == "__main__":
     main()
@@ -1,33 +1,123 @@
 # analyze_relative_change.py
 
+import os
+import sys
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; without it the search falls back to numpy
+    njit = None
+
+# Relative change thresholds reported by analyze_file
+THRESHOLDS = np.array([0.01, 0.001])
+# Rows parsed per block when streaming a data file
+READ_BLOCK_ROWS = 64 * 1024
+
+def load_data(filename):
+    """Read the (step, value) columns of a whole data file as an (N, 2) float array, skipping malformed lines."""
+    data = np.genfromtxt(filename, comments='#', usecols=(0, 1), invalid_raise=False, ndmin=2)
+    return data[~np.isnan(data).any(axis=1)]
+
+def read_blocks(filename, block_rows=READ_BLOCK_ROWS):
+    """Yield the (step, value) columns of a data file as (N, 2) float arrays of up to block_rows rows."""
+    with open(filename) as f:
+        while True:
+            with warnings.catch_warnings():
+                # An exhausted file is the normal end of the stream here
+                warnings.simplefilter('ignore', UserWarning)
+                block = np.loadtxt(f, comments='#', usecols=(0, 1), ndmin=2, max_rows=block_rows)
+            if len(block):
+                yield block
+            if len(block) < block_rows:
+                return
+
+def _first_steps_below_numpy(values, steps, thresholds):
+    """
+    Find, for each threshold, the first step whose relative change from the
+    previous value is below it.
+    
+    Returns:
+        int64 array with one step per threshold, -1 where it is never reached
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rel_changes = np.abs(np.diff(values)) / values[:-1]
+    first_steps = np.full(len(thresholds), -1, dtype=np.int64)
+    for j, threshold in enumerate(thresholds):
+        below = rel_changes < threshold
+        if below.size:
+            idx = np.argmax(below)  # stops at the first True
+            if below[idx]:
+                first_steps[j] = steps[idx + 1]
+    return first_steps
+
+if njit is not None:
+    @njit("int64[:](float64[:], int64[:], float64[:])", cache=True, error_model='numpy')
+    def _first_steps_below(values, steps, thresholds):
+        # Same contract as _first_steps_below_numpy, as one pass without
+        # temporaries that stops once every threshold has been reached
+        first_steps = np.full(thresholds.shape[0], -1, dtype=np.int64)
+        remaining = thresholds.shape[0]
+        for i in range(1, values.shape[0]):
+            rel = abs(values[i] - values[i - 1]) / values[i - 1]
+            for j in range(thresholds.shape[0]):
+                if first_steps[j] < 0 and rel < thresholds[j]:
+                    first_steps[j] = steps[i]
+                    remaining -= 1
+            if remaining == 0:
+                break
+        return first_steps
+else:
+    _first_steps_below = _first_steps_below_numpy
+
+def find_thresholds(filename):
+    """Return the first steps with relative change < 0.01 and < 0.001 (None if never)."""
+    first_steps = np.full(len(THRESHOLDS), -1, dtype=np.int64)
+    try:
+        # Parse block by block and stop reading once every threshold is reached;
+        # each block is prefixed with the last row of the previous one
+        last_row = np.empty((0, 2))
+        for block in read_blocks(filename):
+            block = np.concatenate([last_row, block])
+            pending = first_steps < 0
+            first_steps[pending] = _first_steps_below(
+                np.ascontiguousarray(block[:, 1]), block[:, 0].astype(np.int64), THRESHOLDS[pending])
+            if (first_steps >= 0).all():
+                break
+            last_row = block[-1:]
+    except ValueError:
+        # Malformed lines; parse the whole file tolerantly instead
+        data = load_data(filename)
+        first_steps = _first_steps_below(
+            np.ascontiguousarray(data[:, 1]), data[:, 0].astype(np.int64), THRESHOLDS)
+    return tuple(int(step) if step >= 0 else None for step in first_steps)
+
 def analyze_file(filename):
-    data = []
-    with open(filename, 'r') as f:
-        for line in f:
-            if line.strip() == "" or line.strip().startswith("#"):
-                continue  # skip empty lines or comments
-            parts = line.strip().split()
-            if len(parts) < 2:
-                continue
-            try:
-                step = int(parts[0])
-                val2 = float(parts[1])
-                data.append((step, val2))
-            except ValueError:
-                continue  # skip malformed lines
-
-    rel_changes = []
-    for i in range(1, len(data)):
-        prev_val = data[i-1][1]
-        curr_val = data[i][1]
-        rel = abs(curr_val - prev_val) / prev_val
-        rel_changes.append((data[i][0], rel))
-
-    first_below_0_01 = next((step for step, rel in rel_changes if rel < 0.01), None)
-    first_below_0_001 = next((step for step, rel in rel_changes if rel < 0.001), None)
+    first_below_0_01, first_below_0_001 = find_thresholds(filename)
 
     print("First iteration where relative change < 0.01:", first_below_0_01)
     print("First iteration where relative change < 0.001:", first_below_0_001)
+    return first_below_0_01, first_below_0_001
+
+def analyze_batch(paths):
+    """Run find_thresholds on many files in parallel, returning results in input order."""
+    # Each file is independent; hand several to a worker at a time to
+    # amortize the pickling of arguments and results
+    workers = os.cpu_count() or 1
+    chunksize = max(1, len(paths) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(find_thresholds, paths, chunksize=chunksize))
 
 if __name__ == "__main__":
-    analyze_file("/workspaces/mesa/data/results/seq/CSAIL_3d_geodesic-mesa_2025-08-03_18-44-06/residual_and_ate.txt")
+    # Usage: analyze_data.py [residual_and_ate.txt ...]
+    paths = sys.argv[1:]
+    if not paths:
+        analyze_file("/workspaces/mesa/data/results/seq/CSAIL_3d_geodesic-mesa_2025-08-03_18-44-06/residual_and_ate.txt")
+    else:
+        for path, (first_below_0_01, first_below_0_001) in zip(paths, analyze_batch(paths)):
+            print(f"{path}:")
+            print("  First iteration where relative change < 0.01:", first_below_0_01)
+            print("  First iteration where relative change < 0.001:", first_below_0_001)
@@ -1,6 +1,150 @@
 import gtsam
 import numpy as np
+import matplotlib as mpl
 import matplotlib.pyplot as plt
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; without it the split falls back to numpy
+    njit = None
+
+# gtsam.Symbol keys hold the character in the top byte and the index in the
+# lower 56 bits, so both are read straight off the integer key
+SYMBOL_INDEX_BITS = 56
+SYMBOL_INDEX_MASK = (1 << SYMBOL_INDEX_BITS) - 1
+# Output buffer of save_results_to_txt
+WRITE_BUFFER = 1 << 20
+# Line formats of save_results_to_txt: robot, index, then the pose or point
+POSE3_LINE = "%s %d " + " ".join(["%.9f"] * 7) + "\n"
+POINT3_LINE = "%s %d NaN NaN NaN NaN %s %s %s\n"
+# A jump larger than this between consecutive poses starts a new trajectory piece
+SPLIT_DISTANCE = 7.0
+# Default number of points a trajectory line is decimated to before plotting
+MAX_POINTS = 5000
+
+# Simplify long paths as much as possible and let Agg render them in chunks
+mpl.rcParams['path.simplify_threshold'] = 1.0
+mpl.rcParams['agg.path.chunksize'] = 10000
+
+
+def _piece_numbers_numpy(points, threshold):
+    """
+    Number the trajectory pieces of consecutive points, starting a new piece
+    after every jump longer than threshold (the first point is compared with
+    the origin).
+
+    Returns:
+        int64 array with the piece number of every point
+    """
+    steps = np.diff(points, axis=0, prepend=np.zeros((1, 3)))
+    # Compare squared lengths rather than taking the norm of every step
+    return np.cumsum(np.einsum("ij,ij->i", steps, steps) > threshold * threshold)
+
+
+if njit is not None:
+    @njit("int64[:](float64[:, ::1], float64)", cache=True)
+    def _piece_numbers(points, threshold):
+        # Same contract as _piece_numbers_numpy, as one loop over the points
+        # comparing squared distances
+        pieces = np.empty(points.shape[0], dtype=np.int64)
+        threshold_sq = threshold * threshold
+        n_pieces = 0
+        px = py = pz = 0.0
+        for i in range(points.shape[0]):
+            dx = points[i, 0] - px
+            dy = points[i, 1] - py
+            dz = points[i, 2] - pz
+            if dx * dx + dy * dy + dz * dz > threshold_sq:
+                n_pieces += 1
+            pieces[i] = n_pieces
+            px = points[i, 0]
+            py = points[i, 1]
+            pz = points[i, 2]
+        return pieces
+else:
+    _piece_numbers = _piece_numbers_numpy
+
+
+def _keys(values):
+    """
+    Return the keys of a gtsam.Values as a uint64 array, in the order the
+    Values iterates them. gtsam.Values keeps its keys ordered, i.e. by index
+    within each robot, so trajectories are drawn in pose order and the keys
+    line up with the rows of gtsam.utilities.
+    """
+    return np.fromiter(values.keys(), dtype=np.uint64, count=values.size())
+
+
+def _extract_robot_mask(values, robot_ord):
+    """
+    Return the keys of a gtsam.Values, in its own key order, together with a
+    mask of the keys whose symbol character is robot_ord, decoded from all
+    keys at once.
+    """
+    keys = _keys(values)
+    return keys, (keys >> SYMBOL_INDEX_BITS) == robot_ord
+
+
+def _translations(values, keys, linear, mask=None):
+    """
+    Return the 3D positions of the keys of a gtsam.Values (all of its keys,
+    as returned by _keys), or only of keys[mask], as an (n, 3) array.
+
+    If every value is a Point3 (linear) or Pose3 they are read in one call
+    through gtsam.utilities, which returns them in key order; otherwise only
+    the requested keys are read, key by key.
+    """
+    if linear:
+        rows = gtsam.utilities.extractPoint3(values)
+    else:
+        # Rows hold the rotation matrix followed by the translation
+        rows = gtsam.utilities.extractPose3(values)[:, 9:]
+    if len(rows) == len(keys):
+        rows = rows if mask is None else rows[mask]
+        return np.ascontiguousarray(rows, dtype=np.float64)
+    if mask is not None:
+        keys = keys[mask]
+    # Pick the getter once rather than testing linear for every key
+    if linear:
+        position = values.atPoint3
+    else:
+        at_pose3 = values.atPose3
+
+        def position(k):
+            return at_pose3(k).translation()
+    points = np.empty((len(keys), 3))
+    for i, k in enumerate(keys.tolist()):
+        points[i] = position(k)
+    return points
+
+
+def _positions_2d(values, keys, linear):
+    """Return the 2D positions of keys (a uint64 array) as an (n, 2) array"""
+    # Pick the getter once rather than testing linear for every key
+    if linear:
+        position = values.atPoint2
+    else:
+        at_pose2 = values.atPose2
+
+        def position(k):
+            p = at_pose2(k)
+            return p.x(), p.y()
+    points = np.empty((len(keys), 2))
+    for i, k in enumerate(keys.tolist()):
+        points[i] = position(k)
+    return points
+
+
+def _decimate(points, max_points):
+    """
+    Keep at most max_points evenly spaced points, always including the first
+    and last one (all points if max_points is None)
+    """
+    if max_points is None or len(points) <= max_points:
+        return points
+    return np.asarray(points)[np.linspace(0, len(points) - 1, max_points).astype(int)]
 
 
 def plot_traj_2d(
@@ -12,45 +156,31 @@ def plot_traj_2d(
     include_gt=False,
     include_shared_vars=False,
     linear=False,
+    max_points=MAX_POINTS,
 ):
+    show_gt = include_gt and dataset.containsGroundTruth()
     for idx, robot in enumerate(dataset.robots()):
-        if dataset.containsGroundTruth() and include_gt:
-            gtx, gty = [], []
+        robot_ord = ord(robot)
+        color = colors[idx]
+        if show_gt:
             gtvals = dataset.groundTruth(robot)
-            for k in gtvals.keys():
-                s = gtsam.Symbol(k)
-                if chr(s.chr()) == robot:
-                    if linear:
-                        p = gtvals.atPoint2(k)
-                        gtx.append(p[0])
-                        gty.append(p[1])
-                    else:
-                        p = gtvals.atPose2(k)
-                        gtx.append(p.x())
-                        gty.append(p.y())
-            ax.plot(gtx, gty, alpha=0.5, color=colors[idx])
-
-        sx, sy = [], []
-        ox, oy = [], []
+            gt_keys, gt_mine = _extract_robot_mask(gtvals, robot_ord)
+            gtx, gty = _positions_2d(gtvals, gt_keys[gt_mine], linear).T
+            ax.plot(_decimate(gtx, max_points), _decimate(gty, max_points), alpha=0.5, color=color)
+
+        # Gather every solution point into one array and split it into this
+        # robot's trajectory and the shared variables of other robots with a
+        # mask on the symbol character
         svals = results.robot_solutions[robot].values
-        for k in svals.keys():
-            s = gtsam.Symbol(k)
-            if linear:
-                p = svals.atPoint2(k)
-            else:
-                p = svals.atPose2(k)
-                p = [p.x(), p.y()]
-            if chr(s.chr()) == robot:
-                sx.append(p[0])
-                sy.append(p[1])
-            else:
-                ox.append(p[0])
-                oy.append(p[1])
-
-        ax.plot(sx, sy, alpha=1, color=colors[idx], label=label)
+        keys, mine = _extract_robot_mask(svals, robot_ord)
+        points = _positions_2d(svals, keys, linear)
+        sx, sy = points[mine].T
+
+        ax.plot(_decimate(sx, max_points), _decimate(sy, max_points), alpha=1, color=color, label=label)
 
         if include_shared_vars:
-            ax.plot(ox, oy, "o", color=colors[idx])
+            ox, oy = points[~mine].T
+            ax.plot(ox, oy, "o", color=color)
 
 
 def plot_traj_3d(
@@ -62,49 +192,78 @@ def plot_traj_3d(
     include_gt=False,
     include_shared_vars=False,
     linear=False,
+    max_points=MAX_POINTS,
 ):
+    show_gt = include_gt and dataset.containsGroundTruth()
     for idx, robot in enumerate(dataset.robots()):
-        if dataset.containsGroundTruth() and include_gt:
-            gt = []
+        robot_ord = ord(robot)
+        color = colors[idx]
+        if show_gt:
+            # This robot's ground truth points
             gtvals = dataset.groundTruth(robot)
-            for k in gtvals.keys():
-                s = gtsam.Symbol(k)
-                if chr(s.chr()) == robot:
-                    if linear:
-                        gt.append(gtvals.atPoint3(k))
-                    else:
-                        gt.append(gtvals.atPose3(k).translation())
-            gt = np.stack(gt)
-            ax.plot(gt.T[0], gt.T[1], gt.T[2], alpha=0.5, color=colors[idx])
-
-        prev = np.zeros(3)
-        sol = [[]]
-        oth = []
+            gt_keys, gt_mine = _extract_robot_mask(gtvals, robot_ord)
+            gt = _decimate(_translations(gtvals, gt_keys, linear, gt_mine), max_points)
+            ax.plot(gt[:, 0], gt[:, 1], gt[:, 2], alpha=0.5, color=color)
+
+        # Gather every solution point into one array
         svals = results.robot_solutions[robot].values
-        for k in svals.keys():
-            s = gtsam.Symbol(k)
-            if linear:
-                p = svals.atPoint3(k)
-            else:
-                p = svals.atPose3(k).translation()
-                if np.linalg.norm(prev - p) > 7:
-                    sol.append([])
-                prev = p
-            if chr(s.chr()) == robot:
-                sol[-1].append(p)
-            else:
-                oth.append(p)
-        for partial_sol in sol:
-            if len(partial_sol) >0:
-                partial_sol = np.stack(partial_sol)
-                if len(oth) > 0:
-                    oth = np.stack(oth)
-                ax.plot(partial_sol.T[0], partial_sol.T[1], partial_sol.T[2], alpha=1, color=colors[idx], label=label)
-
-        if include_shared_vars and (len(oth) > 0):
-            ax.plot(oth.T[0], oth.T[1], oth.T[2], "o", color=colors[idx])
+        keys, mine = _extract_robot_mask(svals, robot_ord)
+        points = _translations(svals, keys, linear)
+
+        # Number the pieces of the trajectory; linear solutions are never split
+        if linear:
+            piece = np.zeros(len(keys), dtype=np.int64)
+        else:
+            piece = _piece_numbers(points, SPLIT_DISTANCE)
+
+        # This robot's points, cut wherever the piece number changes and drawn
+        # as a single collection
+        sol = points[mine]
+        breaks = np.flatnonzero(np.diff(piece[mine])) + 1
+        segments = [_decimate(partial_sol, max_points) for partial_sol in np.split(sol, breaks) if len(partial_sol) > 0]
+        if segments:
+            had_data = ax.has_data()
+            ax.add_collection3d(Line3DCollection(segments, colors=color, alpha=1, label=label))
+            ax.auto_scale_xyz(sol[:, 0], sol[:, 1], sol[:, 2], had_data)
+
+        if include_shared_vars:
+            oth = points[~mine]
+            if len(oth) > 0:
+                ax.plot(oth[:, 0], oth[:, 1], oth[:, 2], "o", color=color)
         #ax.view_init(elev=90, azim=-90)
 
+def _format_robot_results(results, robot, linear):
+    """Return the lines of save_results_to_txt for one robot as a single string"""
+    robot_ord = ord(robot)
+    # Extract the Values object for that robot
+    svals = results.robot_solutions[robot].values
+
+    # Only process the keys that are indeed for this robot
+    all_keys, mine = _extract_robot_mask(svals, robot_ord)
+    keys = all_keys[mine]
+    indices = (keys & SYMBOL_INDEX_MASK).tolist()
+    keys = keys.tolist()
+
+    if linear:
+        # If the solution is in Point3 format, there's no orientation
+        # to extract, so 'NaN' is stored instead
+        data = _translations(svals, all_keys, linear, mine)
+        template = POINT3_LINE
+    else:
+        # Otherwise, the solution is assumed to be a Pose3: quaternion
+        # (as w, x, y, z) followed by the translation
+        data = np.empty((len(keys), 7))
+        data[:, 4:] = _translations(svals, all_keys, linear, mine)
+        at_pose3 = svals.atPose3
+        for i, k in enumerate(keys):
+            rotation_quat = at_pose3(k).rotation().toQuaternion()
+            data[i, :4] = rotation_quat.w(), rotation_quat.x(), rotation_quat.y(), rotation_quat.z()
+        template = POSE3_LINE
+
+    # Format all rows from the filled array in one go
+    return "".join([template % (robot, index, *row) for index, row in zip(indices, data.tolist())])
+
+
 def save_results_to_txt(dataset, results, filename, linear=False):
     """
     Save each robot's trajectory from 'results' into a text file.
@@ -117,35 +276,10 @@ def save_results_to_txt(dataset, results, filename, linear=False):
     - w, x, y, z : quaternion components of the orientation
     - tx, ty, tz : translation (position) values
     """
-    with open(filename, 'w') as f:
+    with open(filename, 'w', buffering=WRITE_BUFFER) as f:
         # Optionally, write a header line:
         f.write("# robot key w x y z tx ty tz\n")
 
-        # Loop through each robot in the dataset
+        # Write the formatted block of each robot in turn
         for robot in dataset.robots():
-            # Extract the Values object for that robot
-            svals = results.robot_solutions[robot].values
-
-            # Loop through each key in the Values
-            for k in svals.keys():
-                symbol = gtsam.Symbol(k)
-
-                # Only process if this key is indeed for this robot
-                if chr(symbol.chr()) == robot:
-                    if linear:
-                        # If the solution is in Point3 format
-                        point = svals.atPoint3(k)  # 3D point
-                        # For a linear case, there's no orientation to extract,
-                        # so you might store 'NaN' or skip orientation
-                        f.write(f"{robot} {symbol.index()} NaN NaN NaN NaN {point[0]} {point[1]} {point[2]}\n")
-                    else:
-                        # Otherwise, the solution is assumed to be a Pose3
-                        pose = svals.atPose3(k)
-                        # Extract quaternion (as w, x, y, z)
-                        rotation_quat = pose.rotation().toQuaternion()
-                        w, x, y, z = rotation_quat.w(), rotation_quat.x(), rotation_quat.y(), rotation_quat.z()
-                        # Extract translation
-                        tx, ty, tz = pose.translation()
-                        
-                        # Write a line in the desired format
-                        f.write(f"{robot} {symbol.index()} {w:.9f} {x:.9f} {y:.9f} {z:.9f} {tx:.9f} {ty:.9f} {tz:.9f}\n")
+            f.write(_format_robot_results(results, robot, linear))